@@ -2,9 +2,8 @@
 
 __version__ = "0.1.6"
 
-# Import models and types for public API
-# These are only imported when the user explicitly imports them,
-# not when the package itself is imported
+# Models and types for the public API. These are only imported when the user
+# explicitly accesses them, not when the package itself is imported.
 __all__ = [
     "Model",
     "ModelConfig",
@@ -19,14 +18,40 @@ __all__ = [
     "Slo",
 ]
 
-# Forward references for type checking
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-# Import client for creating instances
-from dell_ai.client import DellAIClient
+# Public names are resolved lazily (PEP 562) so that importing the package, e.g.
+# for ``dell-ai --version``, does not pull in the client and its dependencies.
+_LAZY_IMPORTS = {
+    "Model": "dell_ai.models",
+    "ModelConfig": "dell_ai.models",
+    "Platform": "dell_ai.platforms",
+    "App": "dell_ai.apps",
+    "AppComponent": "dell_ai.apps",
+    "EnvParam": "dell_ai.apps",
+    "Secret": "dell_ai.apps",
+    "DellAIClient": "dell_ai.client",
+    "GoodputReference": "dell_ai.goodput",
+    "Scenario": "dell_ai.goodput",
+    "Slo": "dell_ai.goodput",
+}
 
 if TYPE_CHECKING:
     from dell_ai.apps import App, AppComponent, EnvParam, Secret
+    from dell_ai.client import DellAIClient
     from dell_ai.goodput import GoodputReference, Scenario, Slo
     from dell_ai.models import Model, ModelConfig
     from dell_ai.platforms import Platform
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
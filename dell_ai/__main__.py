@@ -1,6 +1,6 @@
 """Entry point for running the Dell AI CLI as a module."""
 
-from dell_ai.cli.main import app
+from dell_ai.cli import entrypoint
 
 if __name__ == "__main__":
-    app()
+    entrypoint()
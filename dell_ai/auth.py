@@ -1,36 +1,183 @@
 """Authentication functionality for the Dell AI SDK."""
 
+import hashlib
+import json
 import os
-from typing import Any, Dict, Optional
-
-from huggingface_hub import auth_check as hf_auth_check
-from huggingface_hub import login as hf_login
-from huggingface_hub import logout as hf_logout
-from huggingface_hub import whoami
-from huggingface_hub.errors import GatedRepoError, RepositoryNotFoundError
-from huggingface_hub.utils import get_token as hf_get_token
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
 
+from dell_ai import constants
 from dell_ai.exceptions import (
     AuthenticationError,
     GatedRepoAccessError,
     ResourceNotFoundError,
 )
 
+# huggingface_hub is comparatively slow to import, so it is only loaded by the
+# thin wrappers below when an authentication call actually needs it.
+
+
+def hf_get_token() -> Optional[str]:
+    """Read the token from the Hugging Face token cache."""
+    from huggingface_hub.utils import get_token
+
+    return get_token()
+
+
+def hf_login(token: str) -> None:
+    """Log in to the Hugging Face Hub with a token."""
+    from huggingface_hub import login
+
+    login(token=token)
+
+
+def hf_logout() -> None:
+    """Log out from the Hugging Face Hub."""
+    from huggingface_hub import logout
+
+    logout()
+
+
+def whoami(token: str) -> Dict[str, Any]:
+    """Return the Hugging Face Hub user information for a token."""
+    from huggingface_hub import whoami as hf_whoami
+
+    return hf_whoami(token=token)
+
+
+def hf_auth_check(repo_id: str, token: str) -> None:
+    """Check that a token can access a Hugging Face Hub repository."""
+    from huggingface_hub import auth_check
+
+    auth_check(repo_id=repo_id, token=token)
+
+
+# Process-wide memo of the Hugging Face token cache lookup as (populated, token),
+# so a single CLI invocation reads the token file from disk at most once.
+_TOKEN_CACHE: Tuple[bool, Optional[str]] = (False, None)
+
+
+def invalidate_token_cache() -> None:
+    """Forget the memoized token so the next lookup reads it from disk again."""
+    global _TOKEN_CACHE
+    _TOKEN_CACHE = (False, None)
+
+
+def _user_info_cache_key(token: str) -> str:
+    """Return the cache key for a token; the token itself is never stored."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _read_user_info_cache() -> Dict[str, Any]:
+    """Read all user info cache entries, or an empty dict if unavailable."""
+    flags = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0)
+    try:
+        fd = os.open(constants.USER_INFO_CACHE_PATH, flags)
+        with os.fdopen(fd, "r", encoding="utf-8") as cache_file:
+            entries = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _write_user_info_cache(entries: Dict[str, Any]) -> None:
+    """Atomically write the user info cache with owner-only permissions."""
+    cache_path = constants.USER_INFO_CACHE_PATH
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file with 0o600 permissions.
+        fd, temp_path = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=".userinfo-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(entries, cache_file)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        # Cache writes are best-effort; user info should still be returned.
+        return
+
+
+def _is_fresh_user_info_entry(entry: Any, now: float) -> bool:
+    """Return True if a cache entry is well-formed and not expired."""
+    if not isinstance(entry, dict):
+        return False
+    expires_at = entry.get("expires_at")
+    return (
+        isinstance(expires_at, (int, float))
+        and expires_at > now
+        and isinstance(entry.get("user_info"), dict)
+    )
+
+
+def _get_cached_user_info(token: str) -> Optional[Dict[str, Any]]:
+    """Return the cached user info for a token, if present and not expired."""
+    entry = _read_user_info_cache().get(_user_info_cache_key(token))
+    if not _is_fresh_user_info_entry(entry, time.time()):
+        return None
+    return entry["user_info"]
+
+
+def _store_cached_user_info(
+    token: str,
+    info: Dict[str, Any],
+    ttl: float = constants.USER_INFO_CACHE_TTL_SECONDS,
+) -> None:
+    """Cache the user info for a token, pruning expired entries."""
+    now = time.time()
+    entries = {
+        key: entry
+        for key, entry in _read_user_info_cache().items()
+        if _is_fresh_user_info_entry(entry, now)
+    }
+    entries[_user_info_cache_key(token)] = {
+        "expires_at": now + ttl,
+        "user_info": info,
+    }
+    _write_user_info_cache(entries)
+
+
+def _invalidate_cached_user_info(token: Optional[str] = None) -> None:
+    """Drop the cached user info for a token, or the whole cache if no token."""
+    if token is None:
+        try:
+            constants.USER_INFO_CACHE_PATH.unlink()
+        except OSError:
+            pass
+        return
+
+    entries = _read_user_info_cache()
+    if entries.pop(_user_info_cache_key(token), None) is not None:
+        _write_user_info_cache(entries)
+
 
 def get_token() -> Optional[str]:
     """
     Get the Hugging Face token from the environment or the Hugging Face token cache.
 
+    The token cache lookup is memoized for the lifetime of the process; it is
+    refreshed by :func:`login`, :func:`logout` and :func:`invalidate_token_cache`.
+
     Returns:
         The Hugging Face token if available, None otherwise
     """
+    global _TOKEN_CACHE
+
     # First try from environment variable
     token = os.environ.get("HF_TOKEN")
     if token:
         return token
 
     # Then try from the Hugging Face token cache using native method
-    return hf_get_token()
+    populated, cached_token = _TOKEN_CACHE
+    if not populated:
+        cached_token = hf_get_token()
+        _TOKEN_CACHE = (True, cached_token)
+    return cached_token
 
 
 def login(token: str) -> None:
@@ -43,18 +190,25 @@ def login(token: str) -> None:
     Raises:
         AuthenticationError: If login fails or token is invalid
     """
+    global _TOKEN_CACHE
+
     try:
         # Use native login method which also validates the token
         hf_login(token=token)
     except Exception as e:
         raise AuthenticationError(f"Failed to login: {str(e)}")
+    _TOKEN_CACHE = (True, token)
 
 
 def logout() -> None:
     """
     Log out and remove the stored token.
     """
+    global _TOKEN_CACHE
+
     hf_logout()
+    _TOKEN_CACHE = (True, None)
+    _invalidate_cached_user_info()
 
 
 def is_logged_in() -> bool:
@@ -90,6 +244,10 @@ def get_user_info(token: Optional[str] = None) -> Dict[str, Any]:
     """
     Get information about the authenticated user.
 
+    Results are cached on disk for a short time (see
+    ``constants.USER_INFO_CACHE_TTL_SECONDS``) so repeated calls skip the
+    network round trip.
+
     Args:
         token: The Hugging Face token to use. If not provided, will use the
                token from get_token().
@@ -104,11 +262,18 @@ def get_user_info(token: Optional[str] = None) -> Dict[str, Any]:
     if not token:
         raise AuthenticationError("No authentication token found. Please login first.")
 
+    cached_info = _get_cached_user_info(token)
+    if cached_info is not None:
+        return cached_info
+
     try:
-        return whoami(token=token)
+        user_info = whoami(token=token)
     except Exception as e:
         raise AuthenticationError(f"Failed to get user information: {str(e)}")
 
+    _store_cached_user_info(token, user_info)
+    return user_info
+
 
 def check_model_access(model_id: str, token: Optional[str] = None) -> bool:
     """
@@ -127,6 +292,8 @@ def check_model_access(model_id: str, token: Optional[str] = None) -> bool:
         GatedRepoAccessError: If the repository is gated and the user doesn't have access
         ResourceNotFoundError: If the repository doesn't exist
     """
+    from huggingface_hub.errors import GatedRepoError, RepositoryNotFoundError
+
     token = token or get_token()
     if not token:
         raise AuthenticationError("No authentication token found. Please login first.")
@@ -1 +1,20 @@
 """Dell AI CLI package."""
+
+import sys
+
+
+def entrypoint() -> None:
+    """Entry point for the ``dell-ai`` console script and ``python -m dell_ai``.
+
+    ``--version`` is answered before the Typer application (and with it click
+    and rich) is imported, so the most common invocation stays fast.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from dell_ai import __version__
+
+        print(f"dell-ai version: {__version__}")
+        return
+
+    from dell_ai.cli.main import app
+
+    app()
@@ -30,7 +30,6 @@ from dell_ai.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from dell_ai.system_utils.system_info import SystemInfo, get_system_info
 
 app = typer.Typer(
     name="dell-ai",
@@ -129,13 +128,16 @@ def auth_status() -> None:
     """
     Show the current authentication status and user information.
     """
-    if not auth.is_logged_in():
+    # Look the token up once and hand it to get_user_info, which would
+    # otherwise resolve it again.
+    token = auth.get_token()
+    if not token:
         typer.echo("Status: Not logged in")
         typer.echo("To log in, run: dell-ai login")
         return
 
     try:
-        user_info = auth.get_user_info()
+        user_info = auth.get_user_info(token)
         typer.echo("Status: Logged in")
         typer.echo(f"User: {user_info.get('name', 'Unknown')}")
         typer.echo(f"Email: {user_info.get('email', 'Not available')}")
@@ -632,6 +634,8 @@ def utils_describe_system(
     """
     Get the representation for the current system in JSON format
     """
+    from dell_ai.system_utils.system_info import get_system_info
+
     try:
         sys_info = get_system_info()
         if sys_info is not None:
@@ -652,6 +656,8 @@ def utils_check_system():
     """
     Validate system components against recommended configurations
     """
+    from dell_ai.system_utils.system_info import SystemInfo, get_system_info
+
     try:
         sys_info: SystemInfo | None = get_system_info()
         if sys_info is not None:
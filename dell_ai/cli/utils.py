@@ -2,17 +2,25 @@
 
 import json
 import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from dell_ai import DellAIClient
 from dell_ai.exceptions import AuthenticationError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    from dell_ai.client import DellAIClient
+
 SKILLS_DEFINITIONS_DIR = Path(__file__).parent.parent.parent / "skills"
 LOCAL_CENTRAL_SKILLS_DIR = Path(".agents/skills")
 GLOBAL_CENTRAL_SKILLS_DIR = Path("~/.agents/skills")
@@ -41,22 +49,69 @@ def print_json(data: Any) -> None:
     """
     Print data as JSON to stdout.
 
+    orjson is used when installed. Its output matches ``json.dumps`` with these
+    exceptions:
+
+    - single-digit negative float exponents are not zero-padded (``1e-7``
+      rather than ``1e-07``);
+    - NaN and infinity are written as ``null`` rather than ``NaN`` and
+      ``Infinity``;
+    - Enum members that do not subclass str or int are written as their value
+      rather than ``str(member)``.
+
+    Documents orjson cannot encode, such as integers wider than 64 bits, and
+    documents with non-ASCII characters are written with ``json.dumps``.
+
     Args:
         data: Data to print as JSON
     """
     if hasattr(data, "dict"):
         data = data.dict()
-    print(json.dumps(data, indent=2, default=str))
+
+    # Each branch emits the document and its trailing newline in one write.
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and stdout_buffer is not None:
+        try:
+            # Datetimes and dataclasses go through default=str like in json.dumps
+            output = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which json.dumps handles
+            output = None
+
+        # json.dumps escapes non-ASCII characters, orjson writes them as UTF-8
+        if output is not None and output.isascii():
+            # orjson serializes straight to UTF-8 bytes; flush pending text first
+            # so output stays ordered when writing to the underlying binary buffer.
+            sys.stdout.flush()
+            stdout_buffer.write(output)
+            return
+
+    sys.stdout.write(json.dumps(data, indent=2, default=str) + "\n")
 
 
 def print_error(message: str) -> None:
     """
     Print an error message to stderr and exit with status code 1.
-    Uses Rich formatting for better readability.
+    Uses Rich formatting for better readability on a terminal.
 
     Args:
         message: Error message to print
     """
+    if not console.is_terminal:
+        # Pipes and scripts get a plain line in a single write, without
+        # rendering a panel or interpreting markup in the message.
+        sys.stderr.write(f"Error: {message}\n")
+        sys.stderr.flush()
+        raise typer.Exit(code=1)
+
     console.print(
         Panel.fit(
             f"[bold red]Error:[/bold red] {message}",
@@ -67,7 +122,7 @@ def print_error(message: str) -> None:
     raise typer.Exit(code=1)
 
 
-def get_client(token: Optional[str] = None) -> DellAIClient:
+def get_client(token: Optional[str] = None) -> "DellAIClient":
     """
     Create and return a DellAIClient instance.
 
@@ -81,6 +136,8 @@ def get_client(token: Optional[str] = None) -> DellAIClient:
     Raises:
         SystemExit: If authentication fails
     """
+    from dell_ai.client import DellAIClient
+
     try:
         client = DellAIClient(token=token)
     except AuthenticationError as e:
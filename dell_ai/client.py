@@ -1,9 +1,12 @@
 """Main client class for the Dell AI SDK."""
 
+import atexit
+import hashlib
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-
-import requests
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from dell_ai import auth, constants
 from dell_ai.exceptions import (
@@ -12,17 +15,304 @@ from dell_ai.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from dell_ai.system_utils.system_info import SystemInfo
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is an optional speedup
+    ijson = None
 
 if TYPE_CHECKING:
+    import requests
+
     from dell_ai.apps import App
     from dell_ai.goodput import GoodputReference
-    from dell_ai.models import Model
+    from dell_ai.models import Model, SnippetRequest, SnippetSession
     from dell_ai.platforms import Platform
+    from dell_ai.system_utils.system_info import SystemInfo
+
+# Decode response bodies straight from bytes, with orjson when it is installed.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Responses larger than this are parsed incrementally when the caller only needs
+# one top-level key, so the raw body and the full document are never both held.
+_STREAM_THRESHOLD_BYTES = 256 * 1024
+
+# Key of the memoized user info in DellAIClient._cache.
+_USER_INFO_CACHE_KEY = ("user_info",)
+
+# Connection pool sizing. pool_maxsize matches the parallel model search fan-out
+# so concurrent requests reuse keep-alive connections instead of opening new ones.
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 16
+
+# Transient gateway errors are retried with a short exponential backoff.
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.2
+_RETRY_STATUS_FORCELIST = (502, 503, 504)
+
+# (connect, read) timeouts in seconds, so a stalled server cannot hang a call.
+_REQUEST_TIMEOUT = (5.0, 30.0)
+
+# Sessions are shared per (base URL, token) so every client in the process reuses
+# the same connection pool and TLS sessions. Tokens are keyed by their SHA-256
+# digest so the raw credential is only held by the session's headers.
+_SESSIONS: Dict[Tuple[str, str], "requests.Session"] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily expose ``requests``, which is only imported once a client is built."""
+    if name == "requests":
+        import requests
+
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _build_session(token: Optional[str]) -> "requests.Session":
+    """Create a session with pooled, retrying adapters and the default headers."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    session = requests.Session()
+    retry = Retry(
+        total=_RETRY_TOTAL,
+        backoff_factor=_RETRY_BACKOFF_FACTOR,
+        status_forcelist=_RETRY_STATUS_FORCELIST,
+        # Hand the final response back so the usual error handling applies.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Set default headers
+    session.headers.update(
+        {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "dell-ai-sdk/python",
+            # urllib3 lists br and zstd only when their decoders are importable.
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+    )
+    if token:
+        session.headers.update({"Authorization": f"Bearer {token}"})
+    return session
+
+
+def _get_session(base_url: str, token: Optional[str]) -> "requests.Session":
+    """Return the shared session for a base URL and token, creating it once."""
+    key = (base_url, hashlib.sha256(token.encode()).hexdigest() if token else "")
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS[key] = _build_session(token)
+    return session
+
+
+@atexit.register
+def _close_sessions() -> None:
+    """Close the shared sessions and their pooled connections."""
+    with _SESSIONS_LOCK:
+        sessions = list(_SESSIONS.values())
+        _SESSIONS.clear()
+    for session in sessions:
+        session.close()
+
+
+# Error bodies end up in exception messages and CLI output, so credentials the
+# server echoes back are redacted and long bodies are truncated first.
+_MAX_ERROR_BODY_LENGTH = 500
+
+# Redacts "token: ...", "api_key=...", "secret" and "password" values in a
+# single scan; the captured prefix (e.g. "token: ") is kept. Bearer
+# credentials are the common case and are handled by _redact_bearer instead,
+# so a "Bearer " scheme after the field name is kept as part of the prefix.
+_SANITIZE_RE = re.compile(
+    r"(?P<field>(?:token|api[_-]?key|secret|password)[\"']?\s*[:=]\s*[\"']?"
+    r"(?:bearer\s+)?)"
+    r"[^\s\"',}]+",
+    re.IGNORECASE,
+)
+
+
+# Every credential _SANITIZE_RE can match contains one of these (lowercased);
+# "key" covers the api_key, api-key and apikey spellings.
+_SENSITIVE_KEYWORDS = ("token", "key", "secret", "password")
+
+
+def _redact(match: "re.Match[str]") -> str:
+    """Replace a matched credential, keeping its prefix."""
+    return match.group("field") + "[REDACTED]"
+
+
+def _redact_bearer(text: str, lowered: str) -> str:
+    r"""
+    Redact every "Bearer <credential>" in text, keeping the "Bearer " prefix.
+
+    Equivalent to substituting r"(Bearer\s+)\S+" case-insensitively, but
+    built on str.find so that the usual auth error skips the regex engine.
+    ``lowered`` must be a lowercase copy of text with the same length.
+    """
+    parts = []
+    start = 0
+    length = len(text)
+    index = lowered.find("bearer")
+    while index != -1:
+        value_start = index + 6
+        while value_start < length and text[value_start].isspace():
+            value_start += 1
+        value_end = value_start
+        while value_end < length and not text[value_end].isspace():
+            value_end += 1
+        if value_start == index + 6 or value_end == value_start:
+            # "bearer" not followed by whitespace and a credential
+            index = lowered.find("bearer", index + 1)
+            continue
+        parts.append(text[start:value_start])
+        parts.append("[REDACTED]")
+        start = value_end
+        index = lowered.find("bearer", start)
+    if not parts:
+        return text
+    parts.append(text[start:])
+    return "".join(parts)
+
+
+def _sanitize_response(text: str, max_length: int = _MAX_ERROR_BODY_LENGTH) -> str:
+    """Redact credentials from a response body and truncate it for display."""
+    if not text:
+        return ""
+    # Truncating first bounds the redaction work by max_length, however large
+    # the body; the marker is appended afterwards so it is never redacted
+    suffix = ""
+    if len(text) > max_length:
+        text = text[:max_length]
+        suffix = "... (truncated)"
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few non-ASCII characters lowercase to several, which would shift
+        # the indices _redact_bearer takes from lowered; "bearer" is ASCII
+        lowered = "".join(c.lower() if c.isascii() else c for c in text)
+    text = _redact_bearer(text, lowered)
+    # Substring checks are far cheaper than a regex scan, and most error bodies
+    # contain no credentials at all
+    if any(keyword in lowered for keyword in _SENSITIVE_KEYWORDS):
+        text = _SANITIZE_RE.sub(_redact, text)
+    return text + suffix
+
+
+def _decode_error_body(response: "requests.Response") -> str:
+    """Decode an error response body once; the API always responds in UTF-8."""
+    content = response.content
+    if not isinstance(content, bytes):
+        return ""
+    return content.decode("utf-8", errors="replace")
+
+
+def _api_error_message(body: str) -> Optional[str]:
+    """
+    Extract the API's own error message from a JSON error body, if present.
+
+    The API uses either "message" or "error" in its JSON error bodies.
+    """
+    try:
+        error_data = _json_loads(body)
+    except ValueError:
+        return None
+    if isinstance(error_data, dict):
+        return error_data.get("message") or error_data.get("error")
+    return None
+
+
+def _error_message(
+    response: "requests.Response", body: str, api_error_message: Optional[str]
+) -> str:
+    """Return the most specific error message available for a response."""
+    return api_error_message or body or f"HTTP Error: {response.status_code}"
+
+
+def _authentication_error(response, endpoint, body, api_error_message):
+    """Build the error raised for a 401 response."""
+    return AuthenticationError(
+        "Authentication failed. Please check your token or login again."
+    )
+
+
+def _not_found_error(response, endpoint, body, api_error_message):
+    """Build the error raised for a 404 response."""
+    # The resource type is the first path segment and the ID the last one;
+    # partitioning avoids building a list of every segment.
+    resource_type, _, rest = endpoint.strip("/").partition("/")
+    resource_id = rest.rpartition("/")[2] if rest else "unknown"
+
+    return ResourceNotFoundError(resource_type, resource_id, message=api_error_message)
+
+
+def _validation_error(response, endpoint, body, api_error_message):
+    """Build the error raised for a 400 response."""
+    return ValidationError(
+        f"Invalid request: {_error_message(response, body, api_error_message)}"
+    )
+
+
+def _api_error(response, endpoint, body, api_error_message):
+    """Build the error raised for any other error response."""
+    return APIError(
+        _error_message(response, body, api_error_message),
+        status_code=response.status_code,
+        response=body,
+    )
+
+
+# Maps an HTTP error status to the factory building the matching SDK exception;
+# statuses without an entry fall back to _api_error.
+_ERROR_FACTORIES = {
+    401: _authentication_error,
+    404: _not_found_error,
+    400: _validation_error,
+}
+
+
+def _is_large_response(response: "requests.Response") -> bool:
+    """Return True if the declared body size exceeds the streaming threshold."""
+    try:
+        length = int(response.headers.get("Content-Length", ""))
+    except (TypeError, ValueError):
+        return False
+    return length > _STREAM_THRESHOLD_BYTES
 
 
 class DellAIClient:
-    """Main client for interacting with the Dell Enterprise Hub (DEH) API."""
+    """
+    Main client for interacting with the Dell Enterprise Hub (DEH) API.
+
+    Clients created with the same token share one ``session`` (and its
+    connection pool) for the lifetime of the process, so headers or adapters
+    set on ``client.session`` apply to every such client.
+    """
+
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access.
+    __slots__ = (
+        "base_url",
+        "token",
+        "session",
+        "_cache",
+        "_token_valid",
+        "_token_valid_at",
+    )
 
     def __init__(self, token: Optional[str] = None):
         """
@@ -36,25 +326,24 @@ class DellAIClient:
             AuthenticationError: If a token is provided but invalid
         """
         self.base_url = constants.API_BASE_URL
-        self.session = requests.Session()
-
-        # Set default headers
-        self.session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": "dell-ai-sdk/python",
-            }
-        )
+        # Catalog listings, user info and snippet compatibility verdicts,
+        # memoized for the lifetime of the client
+        self._cache: Dict[Tuple, Any] = {}
+        # True once the token has been validated (None until then) and the
+        # time.monotonic() reading when that happened; failures are not kept
+        self._token_valid: Optional[bool] = None
+        self._token_valid_at = 0.0
 
         # Set up authentication
         self.token = token or auth.get_token()
-        if self.token:
-            # If token was explicitly provided, validate it
-            if token and not auth.validate_token(token):
+        # If token was explicitly provided, validate it
+        if token:
+            if not auth.validate_token(token):
                 raise AuthenticationError("Invalid authentication token provided.")
+            self._token_valid = True
+            self._token_valid_at = time.monotonic()
 
-            self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+        self.session = _get_session(self.base_url, self.token)
 
     def _make_request(
         self,
@@ -62,6 +351,7 @@ class DellAIClient:
         endpoint: str,
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
+        stream_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the API.
@@ -71,9 +361,12 @@ class DellAIClient:
             endpoint: API endpoint
             params: Query parameters
             data: Request body data
+            stream_key: Top-level key the caller needs from the response. When
+                set, ijson is installed and the response is large, only this
+                key is parsed, incrementally, from the response stream.
 
         Returns:
-            Response data as a dictionary
+            Response data as a dictionary (only ``stream_key`` when streamed)
 
         Raises:
             AuthenticationError: If authentication fails
@@ -81,86 +374,133 @@ class DellAIClient:
             ResourceNotFoundError: If the requested resource is not found
             ValidationError: If the input parameters are invalid
         """
-        url = f"{self.base_url}{endpoint}"
+        import requests
+        import urllib3
 
+        url = self.base_url + endpoint
+
+        stream = stream_key is not None and ijson is not None
+        # Streamed bodies are read after the request returns, so a dropped
+        # connection or a stalled read can surface from any of these steps.
         try:
             response = self.session.request(
-                method=method, url=url, params=params, json=data
+                method=method,
+                url=url,
+                params=params,
+                json=data,
+                stream=stream,
+                timeout=_REQUEST_TIMEOUT,
             )
-            response.raise_for_status()
-
-            # Ensure we have a valid JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                raise APIError(
-                    "Invalid JSON response from API",
-                    status_code=response.status_code,
-                    response=response.text,
-                )
-
-        except requests.exceptions.HTTPError as e:
-            # Prefer the API's own error message when present. The API uses
-            # either "message" or "error" in its JSON error bodies.
-            api_error_message = None
-            try:
-                error_data = response.json()
-                if isinstance(error_data, dict):
-                    api_error_message = error_data.get("message") or error_data.get(
-                        "error"
-                    )
-            except (json.JSONDecodeError, AttributeError):
-                pass
-
-            error_message = api_error_message or response.text or f"HTTP Error: {e}"
-
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Authentication failed. Please check your token or login again."
-                )
-            elif response.status_code == 404:
-                # Extract resource type and ID from the endpoint
-                parts = endpoint.strip("/").split("/")
-                resource_type = parts[0] if parts else "resource"
-                resource_id = parts[-1] if len(parts) > 1 else "unknown"
-
-                raise ResourceNotFoundError(
-                    resource_type, resource_id, message=api_error_message
-                )
-            elif response.status_code == 400:
-                raise ValidationError(f"Invalid request: {error_message}")
-            else:
-                raise APIError(
-                    error_message,
-                    status_code=response.status_code,
-                    response=response.text,
-                )
+
+            # Checking the status directly keeps exception handling off the
+            # success path (raise_for_status() and response.ok both raise
+            # internally).
+            if response.status_code >= 400:
+                self._raise_for_error(response, endpoint)
+
+            if stream and _is_large_response(response):
+                return self._parse_streamed(response, stream_key)
+
+            content = response.content
         except requests.exceptions.ConnectionError as e:
             raise APIError(f"Connection error: {str(e)}")
-        except requests.exceptions.Timeout as e:
+        except (requests.exceptions.Timeout, urllib3.exceptions.TimeoutError) as e:
             raise APIError(f"Request timed out: {str(e)}")
-        except requests.exceptions.RequestException as e:
+        except (
+            requests.exceptions.RequestException,
+            urllib3.exceptions.HTTPError,
+        ) as e:
             raise APIError(f"Request failed: {str(e)}")
 
+        # Ensure we have a valid JSON response
+        try:
+            return _json_loads(content)
+        except json.JSONDecodeError:
+            raise APIError(
+                "Invalid JSON response from API",
+                status_code=response.status_code,
+                response=_sanitize_response(_decode_error_body(response)),
+            )
+
+    def _raise_for_error(self, response: "requests.Response", endpoint: str) -> None:
+        """Raise the SDK exception matching an error response."""
+        if response.status_code == 401 and self.token:
+            # The token was rejected, so any cached user info is stale.
+            auth._invalidate_cached_user_info(self.token)
+            self._cache.pop(_USER_INFO_CACHE_KEY, None)
+            self._token_valid = None
+        # Decode the body once and derive every error detail from it;
+        # response.text would also run charset detection.
+        body = _decode_error_body(response)
+        api_error_message = _api_error_message(body)
+        if isinstance(api_error_message, str):
+            api_error_message = _sanitize_response(api_error_message)
+        error_factory = _ERROR_FACTORIES.get(response.status_code, _api_error)
+        raise error_factory(
+            response, endpoint, _sanitize_response(body), api_error_message
+        )
+
+    def _parse_streamed(
+        self, response: "requests.Response", stream_key: str
+    ) -> Dict[str, Any]:
+        """Parse only ``stream_key`` from a streamed response body."""
+        # Let urllib3 undo any Content-Encoding while ijson reads the stream.
+        response.raw.decode_content = True
+        try:
+            for value in ijson.items(response.raw, stream_key, use_float=True):
+                return {stream_key: value}
+            return {}
+        except ijson.JSONError:
+            raise APIError(
+                "Invalid JSON response from API",
+                status_code=response.status_code,
+            )
+        finally:
+            response.close()
+
     def is_authenticated(self) -> bool:
         """
         Check if the client has a valid authentication token.
 
+        A successful validation is memoized on the client for
+        ``constants.TOKEN_VALIDATION_TTL_SECONDS``, so a revoked token is
+        noticed; call :meth:`invalidate_cache` to force a new check sooner.
+        A failed validation is never memoized: ``auth.validate_token`` also
+        reports False for timeouts and connection errors, so the next call
+        checks again.
+
         Returns:
             True if the token is valid, False otherwise
         """
         if not self.token:
             return False
 
+        age = time.monotonic() - self._token_valid_at
+        if self._token_valid and age < constants.TOKEN_VALIDATION_TTL_SECONDS:
+            return True
+
         try:
-            return auth.validate_token(self.token)
+            valid = auth.validate_token(self.token)
         except Exception:
             return False
+        if valid:
+            self._token_valid = True
+            self._token_valid_at = time.monotonic()
+        return valid
+
+    def invalidate_cache(self) -> None:
+        """Forget all memoized results: token validation, user info, listings
+        and snippet compatibility verdicts."""
+        self._cache.clear()
+        self._token_valid = None
 
     def get_user_info(self) -> Dict[str, Any]:
         """
         Get information about the authenticated user.
 
+        The result is memoized for the lifetime of the client; call
+        :meth:`invalidate_cache` to refetch.
+
         Returns:
             A dictionary with user information
 
@@ -172,7 +512,9 @@ class DellAIClient:
                 "No authentication token available. Please login first."
             )
 
-        return auth.get_user_info(self.token)
+        if _USER_INFO_CACHE_KEY not in self._cache:
+            self._cache[_USER_INFO_CACHE_KEY] = auth.get_user_info(self.token)
+        return dict(self._cache[_USER_INFO_CACHE_KEY])
 
     def list_models(
         self,
@@ -186,6 +528,9 @@ class DellAIClient:
         """
         Get a list of available model IDs.
 
+        Results are memoized per set of filters for the lifetime of the client;
+        call :meth:`invalidate_cache` to refetch.
+
         Args:
             query: Search query to match against model repo name or description
             multimodal: If set, filter for multimodal (True) or text-only (False) models
@@ -203,15 +548,26 @@ class DellAIClient:
         """
         from dell_ai import models
 
-        return models.list_models(
-            self,
-            query=query,
-            multimodal=multimodal,
-            min_size=min_size,
-            max_size=max_size,
-            license_filter=license_filter,
-            platform_id=platform_id,
+        key = (
+            "models",
+            query,
+            multimodal,
+            min_size,
+            max_size,
+            license_filter,
+            platform_id,
         )
+        if key not in self._cache:
+            self._cache[key] = models.list_models(
+                self,
+                query=query,
+                multimodal=multimodal,
+                min_size=min_size,
+                max_size=max_size,
+                license_filter=license_filter,
+                platform_id=platform_id,
+            )
+        return list(self._cache[key])
 
     def search_models(
         self,
@@ -221,6 +577,7 @@ class DellAIClient:
         max_size: Optional[float] = None,
         license_filter: Optional[str] = None,
         platform_id: Optional[str] = None,
+        expand: bool = False,
     ) -> List["Model"]:
         """
         Search and filter available models.
@@ -234,6 +591,7 @@ class DellAIClient:
             max_size: Maximum model size in millions of parameters
             license_filter: Filter by license type (case-insensitive substring match)
             platform_id: Filter models that support a specific platform SKU
+            expand: Ask the API to return model details inline with the listing
 
         Returns:
             A list of Model objects matching the filter criteria
@@ -252,6 +610,7 @@ class DellAIClient:
             max_size=max_size,
             license_filter=license_filter,
             platform_id=platform_id,
+            expand=expand,
         )
 
     def get_model(self, model_id: str) -> "Model":
@@ -274,6 +633,32 @@ class DellAIClient:
 
         return models.get_model(self, model_id)
 
+    def get_models(
+        self, model_ids: Sequence[str], skip_missing: bool = False
+    ) -> List["Model"]:
+        """
+        Get detailed information about several models at once.
+
+        Model details are fetched in parallel over the shared connection pool.
+
+        Args:
+            model_ids: Model IDs in the format "organization/model_name"
+            skip_missing: If True, leave out models that cannot be found or
+                parsed instead of raising
+
+        Returns:
+            Model objects in the same order as ``model_ids``
+
+        Raises:
+            ValidationError: If a model_id format is invalid (unless skip_missing)
+            ResourceNotFoundError: If a model is not found (unless skip_missing)
+            AuthenticationError: If authentication fails
+            APIError: If the API returns an error
+        """
+        from dell_ai import models
+
+        return models.get_models(self, model_ids, skip_missing=skip_missing)
+
     def get_compatible_platforms(self, model_id: str) -> List:
         """
         Get all platforms compatible with a given model, along with their GPU configurations.
@@ -299,6 +684,9 @@ class DellAIClient:
         """
         Get a list of all available platform SKU IDs.
 
+        Results are memoized for the lifetime of the client; call
+        :meth:`invalidate_cache` to refetch.
+
         Returns:
             A list of platform SKU IDs
 
@@ -308,7 +696,10 @@ class DellAIClient:
         """
         from dell_ai import platforms
 
-        return platforms.list_platforms(self)
+        key = ("platforms",)
+        if key not in self._cache:
+            self._cache[key] = platforms.list_platforms(self)
+        return list(self._cache[key])
 
     def get_platform(self, platform_id: str) -> "Platform":
         """
@@ -412,6 +803,50 @@ class DellAIClient:
             goodput=goodput,
         )
 
+    def get_deployment_snippets(
+        self, configs: Sequence[Union["SnippetRequest", Dict[str, Any]]]
+    ) -> List[str]:
+        """
+        Get deployment snippets for several configurations at once.
+
+        Args:
+            configs: SnippetRequest objects, or dicts with the same fields
+
+        Returns:
+            The deployment snippets, in the same order as ``configs``
+
+        Raises:
+            ValidationError: If any of the configurations are invalid
+            ResourceNotFoundError: If a model, platform, or configuration is not found
+            AuthenticationError: If authentication fails
+            APIError: If the API returns an error
+        """
+        from dell_ai import models
+
+        return models.get_deployment_snippets(self, configs)
+
+    def snippet_session(
+        self, model_id: str, platform_id: str, engine: str
+    ) -> "SnippetSession":
+        """
+        Get a handle for generating snippets of one model at several sizes.
+
+        Args:
+            model_id: The model ID in the format "organization/model_name"
+            platform_id: The platform SKU ID
+            engine: The deployment engine ("docker" or "kubernetes")
+
+        Returns:
+            A SnippetSession whose ``generate(num_gpus, num_replicas)`` returns
+            the deployment snippet for that size
+
+        Raises:
+            ValidationError: If any of the input parameters are invalid
+        """
+        from dell_ai import models
+
+        return models.SnippetSession(self, model_id, platform_id, engine)
+
     def get_goodput_scenarios(self) -> "GoodputReference":
         """
         Get the global goodput reference data (scenarios, SLO docs, SLO targets).
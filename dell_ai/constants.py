@@ -21,5 +21,11 @@ MODEL_CACHE_TTL_SECONDS = 24 * 60 * 60
 GOODPUT_CACHE_DIR = Path.home() / ".cache" / "dell-ai" / "goodput"
 GOODPUT_CACHE_TTL_SECONDS = 24 * 60 * 60
 
+# User info cache (``whoami`` results keyed by a SHA-256 hash of the token)
+USER_INFO_CACHE_PATH = Path.home() / ".cache" / "dell-ai" / "userinfo.json"
+USER_INFO_CACHE_TTL_SECONDS = 10 * 60
+
 # Authentication
 HF_TOKEN_ENV_VAR = "HF_TOKEN"
+# How long a client trusts a successful token validation before rechecking it
+TOKEN_VALIDATION_TTL_SECONDS = 60
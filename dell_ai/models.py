@@ -2,21 +2,69 @@
 
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING, Dict, List, Optional
-
-from pydantic import BaseModel, Field, field_validator, model_validator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    model_validator,
+)
+from pydantic import ValidationError as PydanticValidationError
 
 from dell_ai import constants
-from dell_ai.exceptions import ResourceNotFoundError, ValidationError
+from dell_ai.exceptions import APIError, ResourceNotFoundError, ValidationError
 
 if TYPE_CHECKING:
     from dell_ai.client import DellAIClient
 
-# Maximum number of parallel worker threads used to fetch model details when
-# resolving a search. Tuned for typical hub sizes (~50 models) and HTTPS latency.
+# Maximum number of parallel worker threads used to fetch model details in bulk
+# (get_models and search_models). Tuned for typical hub sizes (~50 models) and
+# HTTPS latency.
 _SEARCH_MAX_WORKERS = 16
 
+# Maximum number of parallel snippet requests issued by get_deployment_snippets.
+# Matches the client's connection pool size so every worker reuses a connection.
+_SNIPPET_MAX_WORKERS = 16
+
+# Snippet endpoint for a model, filled with the URL-encoded creator and model names.
+_DEPLOY_URL_TEMPLATE = constants.SNIPPETS_ENDPOINT + "/models/{}/{}/deploy"
+
+
+def _lower_if_str(value: Any) -> Any:
+    """Lower-case strings ahead of Literal validation, so "Docker" is accepted."""
+    return value.lower() if isinstance(value, str) else value
+
+
+# Deployment engines accepted by the snippet endpoint, lower-cased and checked
+# inside the compiled validator.
+_Engine = Annotated[Literal["docker", "kubernetes"], BeforeValidator(_lower_if_str)]
+
+# "organization/model_name": exactly one slash, with non-empty parts.
+_ModelId = Annotated[str, StringConstraints(pattern=r"^[^/]+/[^/]+$")]
+
+
+@lru_cache(maxsize=256)
+def _model_endpoint(model_id: str) -> str:
+    """Return the API endpoint for a model, reused across bulk lookups."""
+    return constants.MODELS_ENDPOINT + "/" + model_id
+
 
 def _get_model_cache_path(model_id: str):
     """Return the cache file path for a model ID."""
@@ -134,11 +182,13 @@ class SnippetRequest(BaseModel):
     optimized configuration for a goodput scenario.
     """
 
-    model_id: str = Field(
+    model_id: _ModelId = Field(
         ..., description="Model ID in format 'organization/model_name'"
     )
     platform_id: str = Field(..., description="Platform SKU ID")
-    engine: str = Field(..., description="Deployment engine ('docker' or 'kubernetes')")
+    engine: _Engine = Field(
+        ..., description="Deployment engine ('docker' or 'kubernetes')"
+    )
     num_gpus: Optional[int] = Field(
         default=None, gt=0, description="Number of GPUs to use"
     )
@@ -147,15 +197,6 @@ class SnippetRequest(BaseModel):
         default=None, description="Goodput scenario to optimize the snippet for"
     )
 
-    @field_validator("engine")
-    @classmethod
-    def validate_engine(cls, v):
-        if v.lower() not in ["docker", "kubernetes"]:
-            raise ValueError(
-                f"Invalid engine: {v}. Valid types are: docker, kubernetes"
-            )
-        return v.lower()
-
     @model_validator(mode="after")
     def validate_gpus_or_goodput(self):
         if self.goodput is not None and self.num_gpus is not None:
@@ -171,6 +212,61 @@ class SnippetResponse(BaseModel):
     snippet: str = Field(..., description="The deployment snippet text")
 
 
+# Compiled validators for snippet requests, built once at import.
+_SNIPPET_REQUEST_ADAPTER = TypeAdapter(SnippetRequest)
+_SNIPPET_REQUESTS_ADAPTER = TypeAdapter(List[SnippetRequest])
+
+# Message and valid values reported for each invalid snippet request field.
+# Failures without an entry (e.g. cross-field rules) keep Pydantic's message.
+_SNIPPET_FIELD_ERRORS: Dict[str, Tuple[str, Optional[List[str]]]] = {
+    "model_id": ("Invalid model ID, expected 'organization/model_name'.", None),
+    "platform_id": ("Invalid platform ID.", None),
+    "engine": ("Invalid engine.", ["docker", "kubernetes"]),
+    "num_gpus": ("Invalid number of GPUs, expected a positive integer.", None),
+    "num_replicas": ("Invalid number of replicas, expected a positive integer.", None),
+    "goodput": ("Invalid goodput scenario.", None),
+}
+
+
+def _snippet_schema_error(error: PydanticValidationError) -> ValidationError:
+    """
+    Translate a Pydantic error for snippet requests into a ValidationError.
+
+    Every failure is reported in one message. When exactly one field failed,
+    its name and valid values are also set on the error.
+    """
+    failures = []
+    for err in error.errors():
+        loc = err["loc"]
+        # Batch validation prefixes each location with the config's index
+        index = loc[0] if loc and isinstance(loc[0], int) else None
+        if index is not None:
+            loc = loc[1:]
+        field = loc[0] if loc else None
+
+        message, valid_values = _SNIPPET_FIELD_ERRORS.get(field, (None, None))
+        if err["type"] == "missing":
+            message = f"Missing required field '{field}'."
+        elif message is None:
+            message = err["msg"].removeprefix("Value error, ")
+        if index is not None:
+            message = f"Config {index}: {message}"
+        failures.append((field, message, valid_values))
+
+    if len(failures) == 1:
+        field, message, valid_values = failures[0]
+        return ValidationError(
+            message, parameter=field, valid_values=valid_values, original_error=error
+        )
+
+    messages = []
+    for field, message, valid_values in failures:
+        if valid_values:
+            message = f"{message} Valid values for '{field}': {', '.join(valid_values)}"
+        messages.append(message)
+    return ValidationError("\n".join(messages), original_error=error)
+
+
 def list_models(
     client: "DellAIClient",
     query: Optional[str] = None,
@@ -199,6 +295,19 @@ def list_models(
         AuthenticationError: If authentication fails
         APIError: If the API returns an error
     """
+    params = _list_models_params(
+        query, multimodal, min_size, max_size, license_filter, platform_id
+    )
+    response = client._make_request(
+        "GET", constants.MODELS_ENDPOINT, params=params or None, stream_key="models"
+    )
+    return response.get("models", [])
+
+
+def _list_models_params(
+    query, multimodal, min_size, max_size, license_filter, platform_id
+) -> Dict[str, object]:
+    """Build the models endpoint query parameters, leaving out unset filters."""
     params = {
         "query": query,
         "multimodal": multimodal,
@@ -207,12 +316,7 @@ def list_models(
         "license": license_filter,
         "platform-id": platform_id,
     }
-    params = {key: value for key, value in params.items() if value is not None}
-
-    response = client._make_request(
-        "GET", constants.MODELS_ENDPOINT, params=params or None
-    )
-    return response.get("models", [])
+    return {key: value for key, value in params.items() if value is not None}
 
 
 def search_models(
@@ -223,6 +327,7 @@ def search_models(
     max_size: Optional[float] = None,
     license_filter: Optional[str] = None,
     platform_id: Optional[str] = None,
+    expand: bool = False,
 ) -> List[Model]:
     """
     Search and filter available models.
@@ -230,9 +335,11 @@ def search_models(
     Fetches all models and filters them based on the provided criteria.
 
     Performance notes:
-        Model ID filtering happens in the API. This function resolves the returned
-        IDs into model details in parallel (see ``_SEARCH_MAX_WORKERS``), using the
-        on-disk model cache when entries are fresh.
+        Model filtering happens in the API. With ``expand=True`` the listing
+        is requested with ``expand=details`` so model details can come back
+        inline in a single round trip. Entries the API returns as bare IDs are
+        resolved in parallel (see ``_SEARCH_MAX_WORKERS``), using the on-disk
+        model cache when entries are fresh.
 
     Args:
         client: The Dell AI client
@@ -242,6 +349,8 @@ def search_models(
         max_size: Maximum model size in millions of parameters
         license_filter: Filter by license type (case-insensitive substring match)
         platform_id: Filter models that support a specific platform SKU
+        expand: Ask the API to return model details inline with the listing
+            (``expand=details``); off by default for servers without support
 
     Returns:
         A list of Model objects matching the filter criteria
@@ -250,26 +359,36 @@ def search_models(
         AuthenticationError: If authentication fails
         APIError: If the API returns an error
     """
-    model_ids = list_models(
-        client, query, multimodal, min_size, max_size, license_filter, platform_id
+    params = _list_models_params(
+        query, multimodal, min_size, max_size, license_filter, platform_id
+    )
+    if expand:
+        params["expand"] = "details"
+    response = client._make_request(
+        "GET", constants.MODELS_ENDPOINT, params=params, stream_key="models"
     )
+    items = response.get("models", [])
+
+    # Inline details are used as-is; bare IDs (an API without expand support)
+    # fall back to parallel detail lookups.
+    model_ids = [item for item in items if isinstance(item, str)]
+    fetched = {
+        model.repo_name: model
+        for model in get_models(client, model_ids, skip_missing=True)
+    }
 
-    # Fetch all model details in parallel. get_model() uses the on-disk cache, so
-    # repeated detail lookups avoid network calls until cache entries expire.
-    # I/O-bound fan-out: ~16 workers cuts a 50-model cold search from ~15s to ~1s.
     models: List[Model] = []
-    with ThreadPoolExecutor(max_workers=_SEARCH_MAX_WORKERS) as executor:
-        future_to_id = {
-            executor.submit(get_model, client, mid): mid for mid in model_ids
-        }
-        for future in as_completed(future_to_id):
+    for item in items:
+        if isinstance(item, str):
+            model = fetched.get(item)
+        else:
             try:
-                models.append(future.result())
-            except (ResourceNotFoundError, ValidationError):
-                # Skip individual models that can't be fetched/parsed; AuthenticationError
-                # and APIError still propagate so callers see real failures.
-                continue
-
+                model = Model.model_validate(item)
+            except ValueError:
+                # Skip entries that can't be parsed, as for detail lookups
+                model = None
+        if model is not None:
+            models.append(model)
     return models
 
 
@@ -302,8 +421,7 @@ def get_model(client: "DellAIClient", model_id: str) -> Model:
         return cached_model
 
     try:
-        endpoint = f"{constants.MODELS_ENDPOINT}/{model_id}"
-        response = client._make_request("GET", endpoint)
+        response = client._make_request("GET", _model_endpoint(model_id))
 
         model = Model.model_validate(response)
         _write_cached_model(model_id, model.model_dump(by_alias=True))
@@ -313,6 +431,50 @@ def get_model(client: "DellAIClient", model_id: str) -> Model:
         raise ResourceNotFoundError("model", model_id)
 
 
+def get_models(
+    client: "DellAIClient", model_ids: Sequence[str], skip_missing: bool = False
+) -> List[Model]:
+    """
+    Get detailed information about several models at once.
+
+    Model details are fetched in parallel (see ``_SEARCH_MAX_WORKERS``), and
+    get_model() serves fresh entries from the on-disk model cache.
+
+    Args:
+        client: The Dell AI client
+        model_ids: Model IDs in the format "organization/model_name"
+        skip_missing: If True, leave out models that cannot be found or parsed
+            instead of raising
+
+    Returns:
+        Model objects in the same order as ``model_ids``
+
+    Raises:
+        ValidationError: If a model_id format is invalid (unless skip_missing)
+        ResourceNotFoundError: If a model is not found (unless skip_missing)
+        AuthenticationError: If authentication fails
+        APIError: If the API returns an error
+    """
+    if not model_ids:
+        return []
+
+    # I/O-bound fan-out: ~16 workers cuts a 50-model cold fetch from ~15s to ~1s.
+    workers = min(_SEARCH_MAX_WORKERS, len(model_ids))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(get_model, client, mid) for mid in model_ids]
+
+    models: List[Model] = []
+    for future in futures:
+        try:
+            models.append(future.result())
+        except (ResourceNotFoundError, ValidationError):
+            # Only these are skippable; AuthenticationError and APIError always
+            # propagate so callers see real failures.
+            if not skip_missing:
+                raise
+    return models
+
+
 class PlatformCompatibility(BaseModel):
     """Represents a compatible platform configuration for a model."""
 
@@ -365,72 +527,51 @@ def _validate_request_schema(
         num_replicas: Number of replicas
         goodput: Optional goodput scenario to optimize for
 
-    Raises:
-        ValidationError: If the parameters don't match the expected schema
-    """
-    try:
-        # Let Pydantic handle all validation
-        _ = SnippetRequest(
-            model_id=model_id,
-            platform_id=platform_id,
-            engine=engine,
-            num_gpus=num_gpus,
-            num_replicas=num_replicas,
-            goodput=goodput,
-        )
-    except ValueError as e:
-        # Simply convert to our custom ValidationError while preserving the original error
-        # This maintains a consistent error hierarchy without losing Pydantic's detailed info
-        raise ValidationError(str(e), original_error=e)
-
-
-def _validate_model_id_format(model_id):
-    """
-    Validate that the model ID follows the expected format.
-
-    Args:
-        model_id: The model ID to validate
-
     Returns:
-        tuple: (creator_name, model_name)
+        SnippetRequest: The validated request, with normalized field values
 
     Raises:
-        ValidationError: If the model ID format is invalid
+        ValidationError: If the parameters don't match the expected schema
     """
     try:
-        creator_name, model_name = model_id.split("/")
-        return creator_name, model_name
-    except ValueError:
-        raise ValidationError(
-            f"Invalid model_id format: {model_id}. Expected format: 'organization/model_name'"
+        # Let Pydantic handle all validation
+        return _SNIPPET_REQUEST_ADAPTER.validate_python(
+            {
+                "model_id": model_id,
+                "platform_id": platform_id,
+                "engine": engine,
+                "num_gpus": num_gpus,
+                "num_replicas": num_replicas,
+                "goodput": goodput,
+            }
         )
+    except PydanticValidationError as e:
+        raise _snippet_schema_error(e)
 
 
-def _validate_model_platform_compatibility(client, model_id, platform_id, num_gpus):
+def _compatibility_problem(model, model_id, platform_id, num_gpus):
     """
-    Validate that the model and platform combination is valid and the GPU configuration is supported.
+    Describe why the model cannot run with the given platform and GPU count.
 
     Args:
-        client: The Dell AI client
+        model: The fetched model
         model_id: The model ID
         platform_id: The platform SKU ID
         num_gpus: The number of GPUs to use
 
-    Raises:
-        ValidationError: If the platform is not supported or the GPU configuration is invalid
-        ResourceNotFoundError: If the model is not found
+    Returns:
+        Optional[Dict]: Keyword arguments for a ValidationError, or None if the
+        configuration is supported
     """
-    model = get_model(client, model_id)
-
     # Check if the platform is supported
     if platform_id not in model.configs_deploy.config_per_sku:
         supported_platforms = list(model.configs_deploy.config_per_sku.keys())
         platform_list = ", ".join(supported_platforms)
-        raise ValidationError(
-            f"Platform {platform_id} is not supported for model {model_id}. Supported platforms: {platform_list}",
-            parameter="platform_id",
-            valid_values=supported_platforms,
-        )
+        return {
+            "message": f"Platform {platform_id} is not supported for model {model_id}. Supported platforms: {platform_list}",
+            "parameter": "platform_id",
+            "valid_values": supported_platforms,
+        }
 
     # Validate the GPU configuration
     valid_configs = model.configs_deploy.config_per_sku[platform_id]
@@ -438,19 +579,52 @@ def _validate_model_platform_compatibility(client, model_id, platform_id, num_gp
 
     if num_gpus not in valid_gpus:
         gpu_list = ", ".join(str(g) for g in sorted(valid_gpus))
-        raise ValidationError(
-            f"Invalid number of GPUs ({num_gpus}) for model {model_id} on platform {platform_id}. Valid GPU counts: {gpu_list}",
-            parameter="num_gpus",
-            valid_values=sorted(valid_gpus),
-            config_details={
+        return {
+            "message": f"Invalid number of GPUs ({num_gpus}) for model {model_id} on platform {platform_id}. Valid GPU counts: {gpu_list}",
+            "parameter": "num_gpus",
+            "valid_values": sorted(valid_gpus),
+            "config_details": {
                 "model_id": model_id,
                 "platform_id": platform_id,
                 "valid_configs": valid_configs,
             },
+        }
+
+    return None
+
+
+def _check_compatibility(client, model_id, platform_id, num_gpus):
+    """
+    Validate model and platform compatibility, memoizing the verdict on the client.
+
+    The model and the reason it is incompatible, if any, are kept in the client's
+    memo keyed by (model_id, platform_id, num_gpus), so generating snippets for
+    several engines or replica counts validates each configuration once. A new
+    ValidationError is raised from the memoized data on every call.
+    ``client.invalidate_cache()`` clears the verdicts.
+
+    Returns:
+        Model: The fetched model
+
+    Raises:
+        ValidationError: If the platform or GPU configuration is not supported
+        ResourceNotFoundError: If the model is not found (never memoized)
+    """
+    key = ("compatibility", model_id, platform_id, num_gpus)
+    if key not in client._cache:
+        model = get_model(client, model_id)
+        client._cache[key] = (
+            model,
+            _compatibility_problem(model, model_id, platform_id, num_gpus),
         )
 
+    model, problem = client._cache[key]
+    if problem is not None:
+        raise ValidationError(**problem)
+    return model
 
-def _handle_resource_not_found(client, e, model_id, platform_id, num_gpus):
+
+def _handle_resource_not_found(client, e, model_id, platform_id, num_gpus, model=None):
     """
     Handle ResourceNotFoundError by providing more specific error messages.
 
@@ -460,6 +634,7 @@ def _handle_resource_not_found(client, e, model_id, platform_id, num_gpus):
         model_id: The model ID
         platform_id: The platform SKU ID
         num_gpus: The number of GPUs
+        model: The model, if it was already fetched during validation
 
     Raises:
         ResourceNotFoundError: With a more specific error message
@@ -470,29 +645,95 @@ def _handle_resource_not_found(client, e, model_id, platform_id, num_gpus):
         raise ResourceNotFoundError("model", model_id)
 
     # If we can get the model details, check if this might be a configuration issue
-    try:
-        model = get_model(client, model_id)
-
-        # Check if platform is valid but GPU config is invalid
-        if platform_id in model.configs_deploy:
-            valid_configs = model.configs_deploy[platform_id]
-            valid_gpus = {config.num_gpus for config in valid_configs}
-
-            if num_gpus not in valid_gpus:
-                gpu_list = ", ".join(str(g) for g in sorted(valid_gpus))
-                raise ValidationError(
-                    f"Invalid number of GPUs ({num_gpus}) for model {model_id} on platform {platform_id}. Valid GPU counts: {gpu_list}",
-                    parameter="num_gpus",
-                    valid_values=sorted(valid_gpus),
-                )
-    except ResourceNotFoundError:
-        # The model truly doesn't exist
-        raise ResourceNotFoundError("model", model_id)
+    if model is None:
+        try:
+            model = get_model(client, model_id)
+        except ResourceNotFoundError:
+            # The model truly doesn't exist
+            raise ResourceNotFoundError("model", model_id)
+
+    # Check if platform is valid but GPU config is invalid
+    valid_configs = model.configs_deploy.config_per_sku.get(platform_id)
+    if valid_configs is not None:
+        valid_gpus = {config.num_gpus for config in valid_configs}
+
+        if num_gpus not in valid_gpus:
+            gpu_list = ", ".join(str(g) for g in sorted(valid_gpus))
+            raise ValidationError(
+                f"Invalid number of GPUs ({num_gpus}) for model {model_id} on platform {platform_id}. Valid GPU counts: {gpu_list}",
+                parameter="num_gpus",
+                valid_values=sorted(valid_gpus),
+            )
 
     # If we couldn't determine a more specific cause, re-raise the original error
     raise e
 
 
+def _deploy_path(creator_name: str, model_name: str) -> str:
+    """Return the snippet endpoint path for a model."""
+    # Path segments are fully encoded (safe="") so characters such as "+" or
+    # "#" in a name cannot change the route; query params are encoded by requests.
+    return _DEPLOY_URL_TEMPLATE.format(
+        quote(creator_name, safe=""), quote(model_name, safe="")
+    )
+
+
+def _snippet_from_response(response: Dict[str, Any]) -> str:
+    """Extract the snippet text from a snippet endpoint response."""
+    # A single string field needs no model; check its type directly
+    snippet = response.get("snippet", "")
+    if not isinstance(snippet, str):
+        raise APIError("Invalid snippet in API response", response=str(snippet))
+    return snippet
+
+
+def _request_snippet_with_validation(
+    client, path, params, model_id, platform_id, num_gpus
+):
+    """
+    Request a snippet, validating the configuration only if the request fails.
+
+    The happy path costs a single round trip: the API is the authority on which
+    configurations it can serve, so a returned snippet needs no client-side
+    check. When the API rejects the request (400 or 404), the compatibility
+    check runs inline and a ValidationError from it takes precedence over the
+    API's error, since it names the offending parameter and its valid values.
+    Any other error is raised unchanged.
+
+    Args:
+        client: The Dell AI client
+        path: The snippet endpoint path
+        params: The snippet query parameters
+        model_id: The model ID
+        platform_id: The platform SKU ID
+        num_gpus: The number of GPUs
+
+    Returns:
+        The snippet endpoint's response
+
+    Raises:
+        ValidationError: If the platform or GPU configuration is not supported
+        ResourceNotFoundError: If the model, platform, or configuration is not found
+    """
+    try:
+        return client._make_request("GET", path, params=params, stream_key="snippet")
+    except (ResourceNotFoundError, ValidationError) as snippet_error:
+        # Only a rejected request (400/404) is worth a compatibility check; server
+        # and connection errors propagate as-is rather than waiting on another
+        # request to the same failing API
+        try:
+            # The fetched model is reused for error handling, avoiding a refetch
+            model = _check_compatibility(client, model_id, platform_id, num_gpus)
+        except (ResourceNotFoundError, APIError):
+            # We'll handle this with the API response
+            model = None
+        if isinstance(snippet_error, ResourceNotFoundError):
+            _handle_resource_not_found(
+                client, snippet_error, model_id, platform_id, num_gpus, model=model
+            )
+        raise
+
+
 def get_deployment_snippet(
     client: "DellAIClient",
     model_id: str,
@@ -527,35 +768,24 @@ def get_deployment_snippet(
         ResourceNotFoundError: If the model, platform, or configuration is not found
         GatedRepoAccessError: If the model repository is gated and the user doesn't have access
     """
-    # Step 1: Validate basic request parameters
-    _validate_request_schema(
+    # Step 1: Validate basic request parameters; later steps use the validated
+    # (normalized) values
+    request = _validate_request_schema(
         model_id, platform_id, engine, num_gpus, num_replicas, goodput
     )
 
-    # Step 2: Parse and validate model ID format
-    creator_name, model_name = _validate_model_id_format(model_id)
+    # Step 2: Split the model ID; the schema has already checked its format
+    creator_name, _, model_name = request.model_id.partition("/")
 
     # Step 3: Check if the user has access to the model repository
     # This will raise GatedRepoAccessError if the model is gated and the user doesn't have access
     client.check_model_access(model_id)
 
-    # Step 4: Validate model and platform compatibility for the manual GPU path.
-    # The goodput path leaves sizing to the server, so we forward the scenario
-    # as-is and let the API reject unsupported (platform, scenario) combinations.
-    if goodput is None:
-        try:
-            _validate_model_platform_compatibility(
-                client, model_id, platform_id, num_gpus
-            )
-        except ResourceNotFoundError:
-            # We'll handle this during the API request
-            pass
-
-    # Step 5: Build API path and query parameters
-    path = f"{constants.SNIPPETS_ENDPOINT}/models/{creator_name}/{model_name}/deploy"
+    # Step 4: Build API path and query parameters
+    path = _deploy_path(creator_name, model_name)
     params = {
         "sku": platform_id,  # API still expects "sku" as the parameter name
-        "container": engine,
+        "container": request.engine,
         "replicas": num_replicas,
     }
     if goodput is not None:
@@ -563,11 +793,142 @@ def get_deployment_snippet(
     else:
         params["gpus"] = num_gpus
 
-    # Step 6: Make API request and handle errors
+    # Step 5: Make API request and handle errors. The goodput path leaves sizing
+    # to the server, so we forward the scenario as-is and let the API reject
+    # unsupported (platform, scenario) combinations. The manual GPU path also
+    # checks model and platform compatibility if the API rejects the request,
+    # so the error names the unsupported parameter.
+    if goodput is not None:
+        response = client._make_request(
+            "GET", path, params=params, stream_key="snippet"
+        )
+    else:
+        response = _request_snippet_with_validation(
+            client, path, params, model_id, platform_id, num_gpus
+        )
+
+    return _snippet_from_response(response)
+
+
+def get_deployment_snippets(
+    client: "DellAIClient",
+    configs: Sequence[Union[SnippetRequest, Dict[str, Any]]],
+) -> List[str]:
+    """
+    Get deployment snippets for several configurations at once.
+
+    The whole batch is validated up front, so an invalid entry fails before any
+    request is sent. The snippets are then fetched in parallel (see
+    ``_SNIPPET_MAX_WORKERS``).
+
+    Args:
+        client: The Dell AI client
+        configs: SnippetRequest objects, or dicts with the same fields
+
+    Returns:
+        The deployment snippets, in the same order as ``configs``
+
+    Raises:
+        ValidationError: If any of the configurations are invalid
+        ResourceNotFoundError: If a model, platform, or configuration is not found
+        GatedRepoAccessError: If a model repository is gated and the user doesn't have access
+    """
     try:
-        response = client._make_request("GET", path, params=params)
-    except ResourceNotFoundError as e:
-        if goodput is not None:
-            raise
-        _handle_resource_not_found(client, e, model_id, platform_id, num_gpus)
-    return SnippetResponse(snippet=response.get("snippet", "")).snippet
+        snippet_requests = _SNIPPET_REQUESTS_ADAPTER.validate_python(list(configs))
+    except PydanticValidationError as e:
+        raise _snippet_schema_error(e)
+
+    if not snippet_requests:
+        return []
+
+    workers = min(_SNIPPET_MAX_WORKERS, len(snippet_requests))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                get_deployment_snippet,
+                client,
+                request.model_id,
+                request.platform_id,
+                request.engine,
+                request.num_gpus,
+                request.num_replicas,
+                request.goodput,
+            )
+            for request in snippet_requests
+        ]
+        return [future.result() for future in futures]
+
+
+class SnippetSession:
+    """
+    Deployment snippets for one model, platform and engine at varying sizes.
+
+    The fixed fields are validated and the endpoint path and base query
+    parameters are built once, so each :meth:`generate` call only adds the GPU
+    and replica counts. Snippets are remembered per ``(num_gpus, num_replicas)``,
+    so repeating a size returns without another request. Create sessions with
+    :meth:`DellAIClient.snippet_session`.
+    """
+
+    __slots__ = (
+        "client",
+        "model_id",
+        "platform_id",
+        "engine",
+        "_path",
+        "_base_params",
+        "_access_checked",
+        "_snippets",
+    )
+
+    def __init__(
+        self, client: "DellAIClient", model_id: str, platform_id: str, engine: str
+    ):
+        # The sizing is a placeholder; generate() validates the real values
+        request = _validate_request_schema(model_id, platform_id, engine, 1, 1)
+        creator_name, _, model_name = request.model_id.partition("/")
+
+        self.client = client
+        self.model_id = request.model_id
+        self.platform_id = request.platform_id
+        self.engine = request.engine
+        self._path = _deploy_path(creator_name, model_name)
+        # Never mutated; generate() merges the variable keys into a copy
+        self._base_params = {"sku": request.platform_id, "container": request.engine}
+        self._access_checked = False
+        self._snippets: Dict[Tuple[int, int], str] = {}
+
+    def generate(self, num_gpus: int, num_replicas: int = 1) -> str:
+        """
+        Get the deployment snippet for a GPU and replica count.
+
+        Args:
+            num_gpus: The number of GPUs to use
+            num_replicas: The number of replicas to deploy
+
+        Returns:
+            A string containing the deployment snippet (docker command or k8s manifest)
+
+        Raises:
+            ValidationError: If any of the input parameters are invalid
+            ResourceNotFoundError: If the model, platform, or configuration is not found
+            GatedRepoAccessError: If the model repository is gated and the user doesn't have access
+        """
+        key = (num_gpus, num_replicas)
+        snippet = self._snippets.get(key)
+        if snippet is not None:
+            return snippet
+
+        _validate_request_schema(
+            self.model_id, self.platform_id, self.engine, num_gpus, num_replicas
+        )
+        if not self._access_checked:
+            self.client.check_model_access(self.model_id)
+            self._access_checked = True
+
+        params = self._base_params | {"gpus": num_gpus, "replicas": num_replicas}
+        response = _request_snippet_with_validation(
+            self.client, self._path, params, self.model_id, self.platform_id, num_gpus
+        )
+        snippet = self._snippets[key] = _snippet_from_response(response)
+        return snippet
@@ -1,5 +1,6 @@
 """Platform-related functionality for the Dell AI SDK."""
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, Optional
 
 from pydantic import BaseModel, Field
@@ -12,6 +13,12 @@ if TYPE_CHECKING:
     from dell_ai.client import DellAIClient
 
 
+@lru_cache(maxsize=256)
+def _platform_endpoint(platform_id: str) -> str:
+    """Return the API endpoint for a platform, reused across repeated lookups."""
+    return constants.PLATFORMS_ENDPOINT + "/" + platform_id
+
+
 class Platform(BaseModel):
     """Represents a platform available in the Dell Enterprise Hub."""
 
@@ -83,8 +90,7 @@ def get_platform(client: "DellAIClient", platform_id: str) -> Platform:
         APIError: If the API returns an error
     """
     try:
-        endpoint = f"{constants.PLATFORMS_ENDPOINT}/{platform_id}"
-        response = client._make_request("GET", endpoint)
+        response = client._make_request("GET", _platform_endpoint(platform_id))
         return Platform.model_validate(response)
     except ResourceNotFoundError:
         # Reraise with more specific information
@@ -110,7 +116,7 @@ def get_platform_system_info(
         APIError: If the API returns an error
     """
     try:
-        endpoint = f"{constants.PLATFORMS_ENDPOINT}/{platform_id}/sysinfo"
+        endpoint = _platform_endpoint(platform_id) + "/sysinfo"
         response = client._make_request("GET", endpoint)
         if not isinstance(response, list):
             return [SystemInfo.model_validate(response)]
@@ -4,61 +4,169 @@ Common test fixtures for the dell-ai package.
 
 import json
 import platform
+import socket
+import threading
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
+from dell_ai import auth, client, constants, models, platforms
 from dell_ai.client import DellAIClient
 from dell_ai.system_utils import mem_info, os_info
 from dell_ai.system_utils.base import Printer
 
 
+@pytest.fixture(autouse=True)
+def reset_token_cache():
+    """Fixture that clears the process-wide token memo between tests."""
+    auth.invalidate_token_cache()
+    yield
+    auth.invalidate_token_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_sessions():
+    """Fixture that drops the pooled HTTP sessions between tests."""
+    client._SESSIONS.clear()
+    yield
+    client._SESSIONS.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_function_caches():
+    """
+    Fixture that clears the dell_ai functions memoized with lru_cache after a test.
+
+    Add any newly cached function here so that its results cannot carry over
+    into later tests.
+    """
+    yield
+    models._model_endpoint.cache_clear()
+    platforms._platform_endpoint.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_info_cache(tmp_path, monkeypatch):
+    """Fixture that redirects the on-disk user info cache to a temp directory."""
+    cache_path = tmp_path / "userinfo.json"
+    monkeypatch.setattr(constants, "USER_INFO_CACHE_PATH", cache_path)
+    return cache_path
+
+
+@pytest.fixture(scope="session")
+def load_resource():
+    """
+    Fixture that returns a loader for the JSON payloads in tests/unit/resources.
+
+    Each file is read once per session, but every call parses a fresh copy, so
+    tests can modify the returned data without affecting one another.
+    """
+    resource_path = Path(__file__).parent / "unit" / "resources"
+    contents = {}
+
+    def _load(name):
+        if name not in contents:
+            contents[name] = (resource_path / name).read_text(encoding="utf-8")
+        return json.loads(contents[name])
+
+    return _load
+
+
+class FakeClient:
+    """
+    Minimal stand-in for DellAIClient that answers every _make_request call.
+
+    Set ``response`` to the value to return, or ``error`` to an exception to
+    raise; each call is recorded in ``calls`` as an ``(args, kwargs)`` pair.
+    """
+
+    def __init__(self):
+        self.response = None
+        self.error = None
+        self.calls = []
+        self._cache = {}
+
+    def _make_request(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
 @pytest.fixture
-def mock_api_response():
-    """Fixture that returns a mock API response."""
-    return {
-        "models": [
-            {
-                "repoName": "test-org/test-model",
-                "description": "Test model",
-                "license": "apache-2.0",
-                "creatorType": "user",
-                "size": 1000000,
-                "hasSystemPrompt": False,
-                "isMultimodal": False,
-                "status": "active",
-            }
-        ],
-        "platforms": [
-            {
-                "id": "test-sku",
-                "name": "Test Platform",
-                "disabled": False,
-                "server": "test-server",
-                "vendor": "test-vendor",
-                "gputype": "test-gpu",
-                "gpuram": "16GB",
-                "gpuinterconnect": "test-interconnect",
-                "productName": "Test Product",
-                "totalgpucount": 4,
-                "interconnect-east-west": "test-east-west",
-                "interconnect-north-south": "test-north-south",
-            }
-        ],
-    }
+def fake_client():
+    """Fixture that returns a FakeClient for tests that only stub _make_request."""
+    return FakeClient()
+
+
+@pytest.fixture(scope="module")
+def module_mock_client():
+    """
+    Fixture that returns one MagicMock client shared by a test module.
+
+    Building a MagicMock is comparatively slow, so test modules wrap this in a
+    function-scoped mock_client fixture that calls reset_mock() per test.
+    Plain attributes assigned on the mock survive reset_mock(), so tests set
+    them with monkeypatch instead.
+    """
+    return MagicMock()
 
 
 @pytest.fixture
-def mock_client(mock_api_response):
-    """Fixture that returns a mock DellAIClient instance."""
-    with patch("dell_ai.client.requests") as mock_requests:
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_requests.get.return_value = mock_response
-
-        client = DellAIClient(token="test-token")
-        yield client
+def truncated_server():
+    """
+    Fixture that starts local HTTP servers whose responses are cut off mid-body.
+
+    Call it with the raw bytes to answer every request with (status line,
+    headers and the start of the body); the connection is closed right after
+    sending them. Returns the server's base URL.
+    """
+    servers = []
+
+    def _serve(raw_response):
+        server = socket.create_server(("127.0.0.1", 0))
+        servers.append(server)
+
+        def _handle():
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                with conn:
+                    conn.recv(65536)
+                    conn.sendall(raw_response)
+
+        threading.Thread(target=_handle, daemon=True).start()
+        return f"http://127.0.0.1:{server.getsockname()[1]}"
+
+    yield _serve
+    for server in servers:
+        server.shutdown(socket.SHUT_RDWR)
+        server.close()
+
+
+@pytest.fixture
+def patched_client(mocker):
+    """Fixture that returns a DellAIClient with a mocked session and a valid token."""
+    mocker.patch("dell_ai.client.requests.Session")
+    mocker.patch("dell_ai.client.auth.validate_token", return_value=True)
+    return DellAIClient(token="test-token")
+
+
+@pytest.fixture(scope="class")
+def shared_client(class_mocker):
+    """
+    Fixture that returns one patched DellAIClient shared by a test class.
+
+    Only for tests that leave the client untouched; memoized calls such as
+    list_models or list_platforms need the function-scoped patched_client.
+    The patches stay active until the last test of the class has run.
+    """
+    class_mocker.patch("dell_ai.client.requests.Session")
+    class_mocker.patch("dell_ai.client.auth.validate_token", return_value=True)
+    return DellAIClient(token="test-token")
 
 
 @pytest.fixture
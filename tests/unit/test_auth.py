@@ -1,10 +1,14 @@
 """Unit tests for authentication functions."""
 
+import json
+import os
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 from huggingface_hub.utils import GatedRepoError, RepositoryNotFoundError
 
+from dell_ai import auth
 from dell_ai.auth import check_model_access
 from dell_ai.exceptions import (
     AuthenticationError,
@@ -38,11 +42,9 @@ def test_check_model_access_no_token():
     with patch("dell_ai.auth.get_token") as mock_get_token:
         mock_get_token.return_value = None
 
-        with pytest.raises(AuthenticationError) as exc_info:
+        with pytest.raises(AuthenticationError, match="No authentication token found"):
             check_model_access("test-org/some-model")
 
-        assert "No authentication token found" in str(exc_info.value)
-
 
 def test_check_model_access_gated_repo():
     """Test model access check for a gated repository."""
@@ -83,7 +85,112 @@ def test_check_model_access_other_error():
         # Simulate a generic error
         mock_auth_check.side_effect = Exception("Network error")
 
-        with pytest.raises(AuthenticationError) as exc_info:
+        with pytest.raises(AuthenticationError, match="Failed to check model access"):
             check_model_access("test-org/some-model", token="test-token")
 
-        assert "Failed to check model access" in str(exc_info.value)
+
+def test_get_token_memoizes_token_cache(monkeypatch):
+    """Test that the token cache file is read at most once per process."""
+    monkeypatch.delenv("HF_TOKEN", raising=False)
+    with patch("dell_ai.auth.hf_get_token", return_value="cached-token") as mock_get:
+        assert auth.get_token() == "cached-token"
+        assert auth.get_token() == "cached-token"
+        assert auth.is_logged_in() is True
+
+        mock_get.assert_called_once()
+
+
+def test_get_token_prefers_environment(monkeypatch):
+    """Test that HF_TOKEN takes precedence over the memoized token cache."""
+    monkeypatch.setenv("HF_TOKEN", "env-token")
+    with patch("dell_ai.auth.hf_get_token") as mock_get:
+        assert auth.get_token() == "env-token"
+        mock_get.assert_not_called()
+
+
+def test_login_and_logout_update_token_cache(monkeypatch):
+    """Test that login/logout refresh the memoized token without a disk read."""
+    monkeypatch.delenv("HF_TOKEN", raising=False)
+    with (
+        patch("dell_ai.auth.hf_login"),
+        patch("dell_ai.auth.hf_logout"),
+        patch("dell_ai.auth.hf_get_token") as mock_get,
+    ):
+        auth.login("new-token")
+        assert auth.get_token() == "new-token"
+
+        auth.logout()
+        assert auth.get_token() is None
+        assert auth.is_logged_in() is False
+
+        mock_get.assert_not_called()
+
+
+def test_invalidate_token_cache(monkeypatch):
+    """Test that invalidating the token memo forces a fresh lookup."""
+    monkeypatch.delenv("HF_TOKEN", raising=False)
+    with patch("dell_ai.auth.hf_get_token", side_effect=["old", "new"]) as mock_get:
+        assert auth.get_token() == "old"
+        auth.invalidate_token_cache()
+        assert auth.get_token() == "new"
+        assert mock_get.call_count == 2
+
+
+def test_get_user_info_uses_cache(isolated_user_info_cache):
+    """Test that user info is served from the on-disk cache on repeat calls."""
+    user_info = {"name": "Test User", "orgs": []}
+    with patch("dell_ai.auth.whoami", return_value=user_info) as mock_whoami:
+        assert auth.get_user_info("test-token") == user_info
+        assert auth.get_user_info("test-token") == user_info
+
+        mock_whoami.assert_called_once_with(token="test-token")
+
+    # The token itself is never written, only its hash
+    assert "test-token" not in isolated_user_info_cache.read_text()
+    assert isolated_user_info_cache.stat().st_mode & 0o777 == 0o600
+
+
+def test_get_user_info_cache_is_keyed_by_token():
+    """Test that cached user info is not shared between tokens."""
+    with patch(
+        "dell_ai.auth.whoami", side_effect=[{"name": "Alice"}, {"name": "Bob"}]
+    ) as mock_whoami:
+        assert auth.get_user_info("token-a")["name"] == "Alice"
+        assert auth.get_user_info("token-b")["name"] == "Bob"
+        assert mock_whoami.call_count == 2
+
+
+def test_get_user_info_refreshes_expired_cache(isolated_user_info_cache):
+    """Test that expired user info entries trigger a new lookup."""
+    auth._store_cached_user_info("test-token", {"name": "Old"}, ttl=-1)
+
+    with patch("dell_ai.auth.whoami", return_value={"name": "New"}) as mock_whoami:
+        assert auth.get_user_info("test-token") == {"name": "New"}
+        mock_whoami.assert_called_once()
+
+    entries = json.loads(isolated_user_info_cache.read_text())
+    assert len(entries) == 1
+    assert next(iter(entries.values()))["expires_at"] > time.time()
+
+
+def test_get_user_info_ignores_symlinked_cache(isolated_user_info_cache, tmp_path):
+    """Test that a symlinked cache file is not followed."""
+    target = tmp_path / "elsewhere.json"
+    key = auth._user_info_cache_key("test-token")
+    target.write_text(
+        json.dumps({key: {"expires_at": time.time() + 60, "user_info": {"x": 1}}})
+    )
+    os.symlink(target, isolated_user_info_cache)
+
+    assert auth._get_cached_user_info("test-token") is None
+
+
+def test_logout_clears_user_info_cache(isolated_user_info_cache):
+    """Test that logging out removes cached user info."""
+    auth._store_cached_user_info("test-token", {"name": "Test User"})
+    assert isolated_user_info_cache.exists()
+
+    with patch("dell_ai.auth.hf_logout"):
+        auth.logout()
+
+    assert not isolated_user_info_cache.exists()
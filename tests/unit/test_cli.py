@@ -1,11 +1,18 @@
 """Tests for the Dell AI CLI commands."""
 
+import datetime
+import enum
 import json
+import subprocess
+import sys
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
+from dell_ai import __version__
+from dell_ai.cli import utils as cli_utils
 from dell_ai.cli.main import app
 from dell_ai.exceptions import (
     AuthenticationError,
@@ -20,11 +27,22 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(scope="module")
+def module_auth(module_mocker):
+    """
+    Fixture that patches the authentication module once for this module.
+
+    The patch stays active until the module's last test; use mock_auth,
+    which resets the mock, rather than this fixture directly.
+    """
+    return module_mocker.patch("dell_ai.cli.main.auth")
+
+
 @pytest.fixture
-def mock_auth():
-    """Fixture that mocks the authentication module."""
-    with patch("dell_ai.cli.main.auth") as mock:
-        yield mock
+def mock_auth(module_auth):
+    """Fixture that mocks the authentication module, with no state left over."""
+    module_auth.reset_mock(return_value=True, side_effect=True)
+    return module_auth
 
 
 @pytest.fixture
@@ -131,7 +149,7 @@ def test_auth_logout_not_logged_in(runner, mock_auth):
 def test_auth_status_logged_in(runner, mock_auth):
     """Test whoami command when logged in."""
     # Setup
-    mock_auth.is_logged_in.return_value = True
+    mock_auth.get_token.return_value = "test-token"
     mock_auth.get_user_info.return_value = {
         "name": "Test User",
         "email": "test@example.com",
@@ -147,12 +165,14 @@ def test_auth_status_logged_in(runner, mock_auth):
     assert "User: Test User" in result.output
     assert "Email: test@example.com" in result.output
     assert "Organizations: Test Org" in result.output
+    mock_auth.get_token.assert_called_once_with()
+    mock_auth.get_user_info.assert_called_once_with("test-token")
 
 
 def test_auth_status_not_logged_in(runner, mock_auth):
     """Test whoami command when not logged in."""
     # Setup
-    mock_auth.is_logged_in.return_value = False
+    mock_auth.get_token.return_value = None
 
     # Execute
     result = runner.invoke(app, ["whoami"])
@@ -161,12 +181,13 @@ def test_auth_status_not_logged_in(runner, mock_auth):
     assert result.exit_code == 0
     assert "Status: Not logged in" in result.output
     assert "To log in, run: dell-ai login" in result.output
+    mock_auth.get_user_info.assert_not_called()
 
 
 def test_auth_status_error(runner, mock_auth):
     """Test whoami command with authentication error."""
     # Setup
-    mock_auth.is_logged_in.return_value = True
+    mock_auth.get_token.return_value = "test-token"
     mock_auth.get_user_info.side_effect = AuthenticationError("Token expired")
 
     # Execute
@@ -1003,3 +1024,128 @@ def test_models_get_snippet_goodput_and_gpus_mutually_exclusive(
     assert result.exit_code == 1
     assert "--gpus cannot be combined with --goodput" in result.output
     mock_client.get_deployment_snippet.assert_not_called()
+
+
+def test_cli_import_is_lazy():
+    """Importing the CLI must not load the HTTP or Hugging Face Hub stacks."""
+    code = (
+        "import sys, dell_ai.cli.main; "
+        "print(sorted(m for m in ('requests', 'huggingface_hub') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_version_fast_path_skips_typer():
+    """The console script answers --version without importing Typer."""
+    code = (
+        "import sys; sys.argv = ['dell-ai', '--version']; "
+        "from dell_ai.cli import entrypoint; entrypoint(); "
+        "print('typer' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.splitlines() == [f"dell-ai version: {__version__}", "False"]
+
+
+def test_module_version_fast_path():
+    """python -m dell_ai --version takes the same fast path as the console script."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "dell_ai", "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == f"dell-ai version: {__version__}\n"
+    assert " typer" not in result.stderr
+
+
+def test_entrypoint_survives_cli_main_import():
+    """Importing dell_ai.cli.main does not shadow the console script entry point."""
+    import dell_ai.cli
+    import dell_ai.cli.main  # noqa: F401
+
+    assert callable(dell_ai.cli.entrypoint)
+    assert dell_ai.cli.entrypoint.__module__ == "dell_ai.cli"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_print_json(capsys, monkeypatch, use_orjson):
+    """print_json emits indented JSON with and without the orjson speedup."""
+    if not use_orjson:
+        monkeypatch.setattr(cli_utils, "orjson", None)
+    elif cli_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    data = {"models": ["org/model"], "size": 1.5, "nested": {"ok": True}}
+    cli_utils.print_json(data)
+
+    output = capsys.readouterr().out
+    assert json.loads(output) == data
+    assert output.endswith("}\n")
+    assert '\n  "models"' in output
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"models": ["org/model"], "size": 1.5, "nested": {"ok": True}},
+        {"description": "Modèle multilingue — 日本語"},
+        {"parameters": 2**70},
+        {"created": datetime.datetime(2025, 1, 2, 3, 4, 5)},
+        {8: "GPUs"},
+    ],
+    ids=["plain", "non-ascii", "big-int", "datetime", "int-key"],
+)
+def test_print_json_orjson_matches_stdlib(capsys, monkeypatch, data):
+    """print_json writes the same bytes with and without orjson for these data."""
+    orjson = pytest.importorskip("orjson")
+
+    monkeypatch.setattr(cli_utils, "orjson", orjson)
+    cli_utils.print_json(data)
+    with_orjson = capsys.readouterr().out
+
+    monkeypatch.setattr(cli_utils, "orjson", None)
+    cli_utils.print_json(data)
+    assert with_orjson == capsys.readouterr().out
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@pytest.mark.parametrize(
+    "data, with_orjson, without_orjson",
+    [
+        ({"x": 1e-7}, "1e-7", "1e-07"),
+        ({"x": float("nan")}, "null", "NaN"),
+        ({"x": float("inf")}, "null", "Infinity"),
+        ({"x": Color.RED}, '"red"', '"Color.RED"'),
+    ],
+    ids=["negative-exponent", "nan", "infinity", "enum"],
+)
+def test_print_json_orjson_differences(
+    capsys, monkeypatch, data, with_orjson, without_orjson
+):
+    """The documented cases where orjson output differs from json.dumps."""
+    orjson = pytest.importorskip("orjson")
+
+    monkeypatch.setattr(cli_utils, "orjson", orjson)
+    cli_utils.print_json(data)
+    assert capsys.readouterr().out == f'{{\n  "x": {with_orjson}\n}}\n'
+
+    monkeypatch.setattr(cli_utils, "orjson", None)
+    cli_utils.print_json(data)
+    assert capsys.readouterr().out == f'{{\n  "x": {without_orjson}\n}}\n'
+
+
+def test_print_error_plain_when_not_a_terminal(capsys):
+    """print_error writes a plain line, markup untouched, when stderr is piped."""
+    with pytest.raises(typer.Exit) as exc_info:
+        cli_utils.print_error("bad value [red]x[/red]")
+
+    assert exc_info.value.exit_code == 1
+    assert capsys.readouterr().err == "Error: bad value [red]x[/red]\n"
@@ -1,442 +1,710 @@
 """Unit tests for the DellAIClient class."""
 
-from unittest.mock import MagicMock, call, patch
+import io
+from unittest.mock import MagicMock, sentinel
 
 import pytest
-from requests.exceptions import HTTPError
+import responses
 
-from dell_ai.client import DellAIClient
+from dell_ai import client as client_module
+from dell_ai import constants
+from dell_ai.client import DellAIClient, _sanitize_response
 from dell_ai.exceptions import (
     APIError,
     AuthenticationError,
     GatedRepoAccessError,
+    ResourceNotFoundError,
+    ValidationError,
 )
 
 
+class _FakeResponse:
+    """Plain stand-in for a requests.Response where no call tracking is needed."""
+
+    __slots__ = ("status_code", "content", "headers")
+
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@pytest.fixture(autouse=True)
+def mock_validate(mocker):
+    """Fixture that makes every token validate unless a test says otherwise."""
+    return mocker.patch("dell_ai.client.auth.validate_token", return_value=True)
+
+
+@pytest.fixture
+def rsps():
+    """Fixture that intercepts requests sent through any requests session."""
+    with responses.RequestsMock() as mock:
+        yield mock
+
+
+@pytest.fixture
+def error_response(rsps):
+    """Fixture that registers an error response for an API endpoint."""
+
+    def _register(status, endpoint="/test-endpoint", **kwargs):
+        rsps.get(f"{constants.API_BASE_URL}{endpoint}", status=status, **kwargs)
+
+    return _register
+
+
+@pytest.fixture
+def live_client():
+    """Fixture that returns a client with a real session and a valid token."""
+    return DellAIClient(token="test-token")
+
+
 class TestDellAIClient:
     """Tests for the DellAIClient class."""
 
-    def test_initialization_with_token(self):
+    def test_initialization_with_token(self, mock_validate, mocker):
         """Test client initialization with an explicit token."""
-        with (
-            patch("dell_ai.client.requests.Session") as mock_session_class,
-            patch(
-                "dell_ai.client.auth.validate_token", return_value=True
-            ) as mock_validate,
-        ):
-            mock_session = MagicMock()
-            mock_session.headers = {}
-            mock_session_class.return_value = mock_session
-
-            client = DellAIClient(token="test-token")
-
-            assert client.token == "test-token"
-            assert mock_session.headers["Authorization"] == "Bearer test-token"
-            mock_validate.assert_called_once_with("test-token")
-
-    def test_initialization_without_token(self):
+        mock_session_class = mocker.patch("dell_ai.client.requests.Session")
+        mock_session = MagicMock()
+        mock_session.headers = {}
+        mock_session_class.return_value = mock_session
+
+        client = DellAIClient(token="test-token")
+
+        assert client.token == "test-token"
+        assert mock_session.headers["Authorization"] == "Bearer test-token"
+        mock_validate.assert_called_once_with("test-token")
+
+    def test_initialization_without_token(self, mocker):
         """Test client initialization without a token."""
-        with (
-            patch("dell_ai.client.requests.Session") as mock_session_class,
-            patch("dell_ai.client.auth.get_token", return_value=None) as mock_get_token,
-        ):
-            mock_session = MagicMock()
-            mock_session.headers = {}
-            mock_session_class.return_value = mock_session
+        mock_session_class = mocker.patch("dell_ai.client.requests.Session")
+        mock_get_token = mocker.patch(
+            "dell_ai.client.auth.get_token", return_value=None
+        )
+        mock_session = MagicMock()
+        mock_session.headers = {}
+        mock_session_class.return_value = mock_session
 
-            client = DellAIClient()
+        client = DellAIClient()
 
-            assert client.token is None
-            assert "Authorization" not in mock_session.headers
-            mock_get_token.assert_called_once()
+        assert client.token is None
+        assert "Authorization" not in mock_session.headers
+        mock_get_token.assert_called_once()
 
-    def test_initialization_with_invalid_token(self):
+    def test_initialization_with_invalid_token(self, mock_validate, mocker):
         """Test client initialization with an invalid token."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=False),
-        ):
-            with pytest.raises(AuthenticationError):
-                DellAIClient(token="invalid-token")
-
-    def test_make_request_success(self):
+        mocker.patch("dell_ai.client.requests.Session")
+        mock_validate.return_value = False
+        with pytest.raises(AuthenticationError):
+            DellAIClient(token="invalid-token")
+
+    def test_clients_share_session_per_token(self):
+        """Test that clients reuse one pooled session per token."""
+        first = DellAIClient(token="token-a")
+        second = DellAIClient(token="token-a")
+        other = DellAIClient(token="token-b")
+
+        assert first.session is second.session
+        assert other.session is not first.session
+        assert other.session.headers["Authorization"] == "Bearer token-b"
+        # The pool is keyed by a digest, not the raw token
+        assert not any(
+            "token-a" in part for key in client_module._SESSIONS for part in key
+        )
+
+    def test_client_uses_slots(self):
+        """Test that the client has a fixed attribute layout."""
+        client = DellAIClient(token="test-token")
+
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected = True
+
+    def test_session_uses_pooled_retrying_adapter(self):
+        """Test that the shared session mounts a pooled adapter with retries."""
+        client = DellAIClient(token="test-token")
+
+        adapter = client.session.get_adapter("https://dell.huggingface.co/api")
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_close_sessions(self, mocker):
+        """Test that closing the shared sessions closes and forgets them."""
+        client = DellAIClient(token="test-token")
+        mock_close = mocker.patch.object(client.session, "close")
+
+        client_module._close_sessions()
+
+        mock_close.assert_called_once_with()
+        assert client_module._SESSIONS == {}
+
+    def test_session_negotiates_compression(self):
+        """Test that the session advertises every encoding urllib3 can decode."""
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        client = DellAIClient(token="test-token")
+
+        assert client.session.headers["Accept-Encoding"] == ACCEPT_ENCODING
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_make_request_success(self, live_client, rsps):
         """Test successful API request."""
-        with (
-            patch("dell_ai.client.requests.Session") as mock_session_class,
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-        ):
-            # Setup mock session
-            mock_session = MagicMock()
-            mock_session_class.return_value = mock_session
-
-            # Setup mock response
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"data": "test"}
-            mock_response.status_code = 200
-            mock_session.request.return_value = mock_response
-
-            # Create client and make request
-            client = DellAIClient(token="test-token")
-            result = client._make_request("GET", "/test-endpoint")
-
-            # Verify results
-            assert result == {"data": "test"}
-            mock_session.request.assert_called_once()
-            call_kwargs = mock_session.request.call_args.kwargs
-            assert call_kwargs["method"] == "GET"
-            assert call_kwargs["url"] == "https://dell.huggingface.co/api/test-endpoint"
-
-    def test_make_request_error(self):
+        rsps.get(f"{constants.API_BASE_URL}/test-endpoint", json={"data": "test"})
+
+        result = live_client._make_request("GET", "/test-endpoint")
+
+        assert result == {"data": "test"}
+        assert len(rsps.calls) == 1
+        request = rsps.calls[0].request
+        assert request.url == "https://dell.huggingface.co/api/test-endpoint"
+        assert request.req_kwargs["timeout"] == (5.0, 30.0)
+
+    @pytest.mark.parametrize(
+        "content_length, streamed", [("10", False), (str(1024 * 1024), True)]
+    )
+    def test_make_request_stream_key(self, patched_client, content_length, streamed):
+        """Large responses are parsed incrementally down to the requested key."""
+        if client_module.ijson is None:
+            pytest.skip("ijson is not installed")
+        body = b'{"models": ["org/model1", "org/model2"], "total": 2}'
+
+        mock_session = patched_client.session
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": content_length}
+        mock_response.content = body
+        mock_response.raw = io.BytesIO(body)
+        mock_session.request.return_value = mock_response
+
+        client = patched_client
+        result = client._make_request("GET", "/models", stream_key="models")
+
+        assert result["models"] == ["org/model1", "org/model2"]
+        assert ("total" in result) is not streamed
+        assert mock_session.request.call_args.kwargs["stream"] is True
+        assert mock_response.close.called is streamed
+
+    @pytest.mark.parametrize(
+        "headers",
+        [b"Transfer-Encoding: chunked\r\n", b"Content-Length: 1048576\r\n"],
+        ids=["chunked", "large"],
+    )
+    def test_make_request_truncated_stream(
+        self, live_client, truncated_server, headers
+    ):
+        """A body cut off while it is streamed raises APIError."""
+        if client_module.ijson is None:
+            pytest.skip("ijson is not installed")
+        body = b'{"models": ["org/mo'
+        if headers.startswith(b"Transfer-Encoding"):
+            body = b"%x\r\n" % 64 + body
+        live_client.base_url = truncated_server(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+            + headers
+            + b"\r\n"
+            + body
+        )
+
+        with pytest.raises(APIError, match="Request failed"):
+            live_client._make_request("GET", "/models", stream_key="models")
+
+    def test_make_request_error(self, live_client, error_response):
         """Test error handling in API requests."""
-        with (
-            patch("dell_ai.client.requests.Session") as mock_session_class,
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-        ):
-            # Setup mock session
-            mock_session = MagicMock()
-            mock_session_class.return_value = mock_session
-
-            # Setup mock error response
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.text = "Internal Server Error"
-            mock_response.json.return_value = {"message": "Internal Server Error"}
-
-            # Setup HTTP error
-            http_error = HTTPError(response=mock_response)
-            mock_response.raise_for_status.side_effect = http_error
-            mock_session.request.return_value = mock_response
-
-            # Create client and test error handling
-            client = DellAIClient(token="test-token")
-            with pytest.raises(APIError) as exc_info:
-                client._make_request("GET", "/test-endpoint")
-
-            # Verify error message
-            assert "Internal Server Error" in str(exc_info.value)
-
-    def test_is_authenticated_with_token(self):
-        """Test is_authenticated when a token is available."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token") as mock_validate,
-            patch("dell_ai.client.auth.get_token", return_value="test-token"),
-        ):
-            # First call during initialization should return True
-            # Second call during is_authenticated should return True
-            mock_validate.side_effect = [True, True]
-
-            client = DellAIClient(token="test-token")
-            result = client.is_authenticated()
-
-            assert result is True
-            assert mock_validate.call_count == 2
-            assert mock_validate.call_args_list[1] == call("test-token")
-
-    def test_is_authenticated_without_token(self):
+        error_response(500, json={"message": "Internal Server Error"})
+
+        with pytest.raises(APIError, match="Internal Server Error") as exc_info:
+            live_client._make_request("GET", "/test-endpoint")
+
+        assert exc_info.value.response == '{"message": "Internal Server Error"}'
+
+    def test_make_request_authentication_error(
+        self, live_client, error_response, mocker
+    ):
+        """Test that a 401 response raises AuthenticationError."""
+        mock_invalidate = mocker.patch(
+            "dell_ai.client.auth._invalidate_cached_user_info"
+        )
+        error_response(401, json={"message": "Unauthorized"})
+
+        with pytest.raises(AuthenticationError):
+            live_client._make_request("GET", "/test-endpoint")
+
+        mock_invalidate.assert_called_once_with("test-token")
+
+    def test_make_request_resource_not_found(self, live_client, error_response):
+        """Test that a 404 response raises ResourceNotFoundError."""
+        error_response(
+            404, endpoint="/skus/unknown-sku", json={"error": "SKU not found"}
+        )
+
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            live_client._make_request("GET", "/skus/unknown-sku")
+
+        assert exc_info.value.resource_type == "skus"
+        assert exc_info.value.resource_id == "unknown-sku"
+        assert str(exc_info.value) == "SKU not found"
+
+    @pytest.mark.parametrize(
+        "endpoint, resource_type, resource_id",
+        [
+            ("/models/org/model", "models", "model"),
+            ("/skus/xe9680/sysinfo", "skus", "sysinfo"),
+            ("/goodput-scenarios", "goodput-scenarios", "unknown"),
+        ],
+    )
+    def test_not_found_error_parses_endpoint(
+        self, endpoint, resource_type, resource_id
+    ):
+        """Test how 404 endpoints map onto the resource type and ID."""
+        response = _FakeResponse(404)
+        error = client_module._not_found_error(response, endpoint, "", None)
+
+        assert error.resource_type == resource_type
+        assert error.resource_id == resource_id
+
+    def test_make_request_validation_error(self, live_client, error_response):
+        """Test that a 400 response raises ValidationError."""
+        error_response(400, body="Bad Request")
+
+        with pytest.raises(ValidationError, match="Invalid request: Bad Request"):
+            live_client._make_request("GET", "/test-endpoint")
+
+    def test_make_request_error_sanitizes_sensitive_data(
+        self, live_client, error_response
+    ):
+        """Test that credentials echoed in an error body are redacted."""
+        error_response(
+            500,
+            json={
+                "message": "Rejected header Authorization: Bearer secret_token_12345"
+            },
+        )
+
+        with pytest.raises(APIError, match=r"\[REDACTED\]") as exc_info:
+            live_client._make_request("GET", "/test-endpoint")
+
+        assert "secret_token_12345" not in str(exc_info.value)
+        assert "secret_token_12345" not in exc_info.value.response
+
+    def test_is_authenticated_with_token(self, mock_validate, mocker):
+        """Test is_authenticated reuses the validation done at initialization."""
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value="test-token")
+
+        client = DellAIClient(token="test-token")
+
+        assert client.is_authenticated() is True
+        assert client.is_authenticated() is True
+        mock_validate.assert_called_once_with("test-token")
+
+    def test_is_authenticated_memoizes_stored_token(self, mock_validate, mocker):
+        """Test is_authenticated validates a stored token only once."""
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value="test-token")
+
+        client = DellAIClient()
+
+        assert client.is_authenticated() is True
+        assert client.is_authenticated() is True
+        mock_validate.assert_called_once_with("test-token")
+
+        client.invalidate_cache()
+        assert client.is_authenticated() is True
+        assert mock_validate.call_count == 2
+
+    def test_is_authenticated_revalidates_after_ttl(self, mock_validate, mocker):
+        """Test is_authenticated rechecks the token once the memo expires."""
+        mocker.patch("dell_ai.client.requests.Session")
+        mock_monotonic = mocker.patch(
+            "dell_ai.client.time.monotonic", return_value=1000.0
+        )
+
+        client = DellAIClient(token="test-token")
+        mock_validate.return_value = False
+
+        mock_monotonic.return_value = (
+            1000.0 + constants.TOKEN_VALIDATION_TTL_SECONDS - 1
+        )
+        assert client.is_authenticated() is True
+        assert mock_validate.call_count == 1
+
+        mock_monotonic.return_value = 1000.0 + constants.TOKEN_VALIDATION_TTL_SECONDS
+        assert client.is_authenticated() is False
+        assert mock_validate.call_count == 2
+
+    def test_is_authenticated_without_token(self, mocker):
         """Test is_authenticated when no token is available."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.get_token", return_value=None),
-        ):
-            client = DellAIClient()
-            assert client.is_authenticated() is False
-
-    def test_is_authenticated_with_invalid_token(self):
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value=None)
+        client = DellAIClient()
+        assert client.is_authenticated() is False
+
+    def test_is_authenticated_with_invalid_token(self, mock_validate, mocker):
         """Test is_authenticated when the token is invalid."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token") as mock_validate,
-            patch("dell_ai.client.auth.get_token", return_value="test-token"),
-        ):
-            # First call during initialization should return True
-            # Second call during is_authenticated should return False
-            mock_validate.side_effect = [True, False]
-
-            client = DellAIClient(token="test-token")
-            result = client.is_authenticated()
-
-            assert result is False
-            assert mock_validate.call_count == 2
-
-    def test_is_authenticated_exception(self):
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value="test-token")
+        mock_validate.return_value = False
+
+        client = DellAIClient()
+        result = client.is_authenticated()
+
+        assert result is False
+        mock_validate.assert_called_once_with("test-token")
+
+    def test_is_authenticated_revalidates_after_false(self, mock_validate, mocker):
+        """Test a False validation (e.g. a timeout) is not memoized."""
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value="test-token")
+        mock_validate.return_value = False
+
+        client = DellAIClient()
+        assert client.is_authenticated() is False
+
+        mock_validate.return_value = True
+        assert client.is_authenticated() is True
+        assert client.is_authenticated() is True
+        assert mock_validate.call_count == 2
+
+    def test_is_authenticated_exception(self, mock_validate, mocker):
         """Test is_authenticated when validation raises an exception."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token") as mock_validate,
-            patch("dell_ai.client.auth.get_token", return_value="test-token"),
-        ):
-            # First call during initialization should return True
-            # Second call during is_authenticated should raise Exception
-            mock_validate.side_effect = [True, Exception("Test error")]
-
-            client = DellAIClient(token="test-token")
-            result = client.is_authenticated()
-
-            assert result is False
-            assert mock_validate.call_count == 2
-
-    def test_get_user_info(self):
-        """Test the get_user_info method."""
-        expected_info = {"name": "Test User", "email": "test@example.com"}
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value="test-token")
+        mock_validate.side_effect = Exception("Test error")
 
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.client.auth.get_user_info") as mock_get_info,
-        ):
-            mock_get_info.return_value = expected_info
+        client = DellAIClient()
+        assert client.is_authenticated() is False
 
-            client = DellAIClient(token="test-token")
-            result = client.get_user_info()
+        # Failures are not memoized, so the next call validates again
+        mock_validate.side_effect = None
+        assert client.is_authenticated() is True
+        assert mock_validate.call_count == 2
 
-            assert result == expected_info
-            mock_get_info.assert_called_once_with("test-token")
+    def test_get_user_info(self, patched_client, mocker):
+        """Test the get_user_info method."""
+        expected_info = {"name": "Test User", "email": "test@example.com"}
 
-    def test_get_user_info_no_token(self):
-        """Test get_user_info when no token is available."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.get_token", return_value=None),
-        ):
-            client = DellAIClient()
-            with pytest.raises(AuthenticationError):
-                client.get_user_info()
-
-    def test_check_model_access_success(self):
-        """Test successful model access check."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.client.auth.check_model_access") as mock_check_access,
-        ):
-            mock_check_access.return_value = True
+        mock_get_info = mocker.patch("dell_ai.client.auth.get_user_info")
+        mock_get_info.return_value = expected_info
 
-            client = DellAIClient(token="test-token")
-            result = client.check_model_access("org/model")
+        client = patched_client
+        result = client.get_user_info()
 
-            assert result is True
-            mock_check_access.assert_called_once_with("org/model", "test-token")
+        assert result == expected_info
+        mock_get_info.assert_called_once_with("test-token")
 
-    def test_check_model_access_gated_repo(self):
-        """Test model access check for a gated repository."""
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.client.auth.check_model_access") as mock_check_access,
-        ):
-            mock_check_access.side_effect = GatedRepoAccessError("org/gated-model")
+    def test_get_user_info_is_memoized(self, patched_client, mocker):
+        """Test that user info is fetched once per client until invalidated."""
+        mock_get_info = mocker.patch("dell_ai.client.auth.get_user_info")
+        mock_get_info.return_value = {"name": "Test User"}
 
-            client = DellAIClient(token="test-token")
-            with pytest.raises(GatedRepoAccessError) as exc_info:
-                client.check_model_access("org/gated-model")
+        client = patched_client
+        assert client.get_user_info() == {"name": "Test User"}
+        assert client.get_user_info() == {"name": "Test User"}
+        mock_get_info.assert_called_once_with("test-token")
 
-            assert exc_info.value.model_id == "org/gated-model"
-            assert "Access denied" in str(exc_info.value)
+        client.invalidate_cache()
+        client.get_user_info()
+        assert mock_get_info.call_count == 2
+
+    def test_get_user_info_no_token(self, mocker):
+        """Test get_user_info when no token is available."""
+        mocker.patch("dell_ai.client.requests.Session")
+        mocker.patch("dell_ai.client.auth.get_token", return_value=None)
+        client = DellAIClient()
+        with pytest.raises(AuthenticationError):
+            client.get_user_info()
 
-    def test_list_models(self):
+    def test_list_models(self, patched_client, mocker):
         """Test list_models method."""
         expected_models = ["org/model1", "org/model2"]
 
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.models.list_models") as mock_list_models,
-        ):
-            mock_list_models.return_value = expected_models
-
-            client = DellAIClient(token="test-token")
-            result = client.list_models()
-
-            assert result == expected_models
-            mock_list_models.assert_called_once_with(
-                client,
-                query=None,
-                multimodal=None,
-                min_size=None,
-                max_size=None,
-                license_filter=None,
-                platform_id=None,
-            )
-
-    def test_get_model(self):
-        """Test get_model method."""
-        mock_model = MagicMock()
-
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.models.get_model") as mock_get_model,
-        ):
-            mock_get_model.return_value = mock_model
-
-            client = DellAIClient(token="test-token")
-            result = client.get_model("org/model1")
-
-            assert result == mock_model
-            mock_get_model.assert_called_once_with(client, "org/model1")
-
-    def test_list_platforms(self):
-        """Test list_platforms method."""
-        expected_platforms = ["platform1", "platform2"]
-
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.platforms.list_platforms") as mock_list_platforms,
-        ):
-            mock_list_platforms.return_value = expected_platforms
+        mock_list_models = mocker.patch("dell_ai.models.list_models")
+        mock_list_models.return_value = expected_models
 
-            client = DellAIClient(token="test-token")
-            result = client.list_platforms()
+        client = patched_client
+        result = client.list_models()
 
-            assert result == expected_platforms
-            mock_list_platforms.assert_called_once_with(client)
+        assert result == expected_models
+        mock_list_models.assert_called_once_with(
+            client,
+            query=None,
+            multimodal=None,
+            min_size=None,
+            max_size=None,
+            license_filter=None,
+            platform_id=None,
+        )
 
-    def test_get_platform(self):
-        """Test get_platform method."""
-        mock_platform = MagicMock()
+    def test_list_platforms(self, patched_client, mocker):
+        """Test list_platforms method."""
+        expected_platforms = ["platform1", "platform2"]
 
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.platforms.get_platform") as mock_get_platform,
-        ):
-            mock_get_platform.return_value = mock_platform
+        mock_list_platforms = mocker.patch("dell_ai.platforms.list_platforms")
+        mock_list_platforms.return_value = expected_platforms
+
+        client = patched_client
+        result = client.list_platforms()
+
+        assert result == expected_platforms
+        mock_list_platforms.assert_called_once_with(client)
+
+    def test_listings_are_memoized(self, patched_client, mocker):
+        """Test list_models and list_platforms reuse results until invalidated."""
+        mock_list_models = mocker.patch("dell_ai.models.list_models")
+        mock_list_platforms = mocker.patch("dell_ai.platforms.list_platforms")
+        mock_list_models.return_value = ["org/model1"]
+        mock_list_platforms.return_value = ["platform1"]
+
+        client = patched_client
+        assert client.list_models() == ["org/model1"]
+        assert client.list_models() == ["org/model1"]
+        assert client.list_platforms() == ["platform1"]
+        assert client.list_platforms() == ["platform1"]
+        assert mock_list_models.call_count == 1
+        assert mock_list_platforms.call_count == 1
+
+        # Different filters are cached separately
+        client.list_models(query="llama")
+        assert mock_list_models.call_count == 2
+
+        client.invalidate_cache()
+        client.list_models()
+        client.list_platforms()
+        assert mock_list_models.call_count == 3
+        assert mock_list_platforms.call_count == 2
+
+    @pytest.mark.parametrize(
+        "text, secrets, redact_count",
+        [
+            (
+                "Error: Bearer abc123xyz789token in header",
+                ["abc123xyz789token"],
+                1,
+            ),
+            (
+                '{"token": "abcdefghij1234567890secrettoken"}',
+                ["abcdefghij1234567890secrettoken"],
+                1,
+            ),
+            (
+                "api_key: sk_live_abcdefghij1234567890",
+                ["sk_live_abcdefghij1234567890"],
+                1,
+            ),
+            ("secret=mysupersecretvalue123", ["mysupersecretvalue123"], 1),
+            ('{"password": "hunter2hunter2"}', ["hunter2hunter2"], 1),
+            ("BEARER abc123 and Token: def456", ["abc123", "def456"], 2),
+            (
+                '{"api_key": "key123456", "password": "pw123456", "secret": "s123456"}',
+                ["key123456", "pw123456", "s123456"],
+                3,
+            ),
+        ],
+    )
+    def test_sanitize_redacts(self, text, secrets, redact_count):
+        """Credentials in error responses are replaced with [REDACTED]."""
+        result = _sanitize_response(text)
+        for secret in secrets:
+            assert secret not in result
+        assert result.count("[REDACTED]") == redact_count
+
+    def test_sanitize_keeps_bearer_prefix(self):
+        """The Bearer scheme is kept and only the token after it is redacted."""
+        result = _sanitize_response("Error: Bearer abc123xyz789token in header")
+        assert result == "Error: Bearer [REDACTED] in header"
+
+    def test_sanitize_normal_text(self):
+        """Text without credentials is returned unchanged."""
+        text = "Model not found: org/model"
+        assert _sanitize_response(text) == text
+
+    def test_sanitize_skips_regex_without_keywords(self, mocker):
+        """Text with no credential keyword never reaches the redaction regex."""
+        mock_re = mocker.patch.object(client_module, "_SANITIZE_RE")
+        assert _sanitize_response("Model not found") == "Model not found"
+        mock_re.sub.assert_not_called()
+
+    def test_sanitize_bearer_skips_regex(self, mocker):
+        """Bearer-only text is redacted without running the redaction regex."""
+        mock_re = mocker.patch.object(client_module, "_SANITIZE_RE")
+        result = _sanitize_response("Invalid credentials: Bearer abc123")
+        assert result == "Invalid credentials: Bearer [REDACTED]"
+        mock_re.sub.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("bearer\tabc123", "bearer\t[REDACTED]"),
+            ("Bearer a, Bearer b", "Bearer [REDACTED] Bearer [REDACTED]"),
+            ("Bearerabc123 missing", "Bearerabc123 missing"),
+            ("trailing Bearer ", "trailing Bearer "),
+            ("Token: Bearer abc123", "Token: Bearer [REDACTED]"),
+        ],
+    )
+    def test_sanitize_bearer_edge_cases(self, text, expected):
+        """Bearer redaction handles tabs, repeats, missing separators and trailing prefixes."""
+        assert _sanitize_response(text) == expected
+
+    def test_sanitize_truncates_long_response(self):
+        """Responses longer than 500 characters are cut and marked as truncated."""
+        result = _sanitize_response("x" * 1000)
+        assert result.startswith("x" * 500)
+        assert result.endswith("... (truncated)")
+        assert len(result) == 500 + len("... (truncated)")
+
+    def test_sanitize_redacts_secret_cut_by_truncation(self):
+        """A token that straddles the truncation point is still redacted."""
+        result = _sanitize_response("x" * 480 + " Bearer abcdefghijklmnopqrstuvwxyz")
+        assert "abcdefghijk" not in result
+        assert result.endswith("Bearer [REDACTED]... (truncated)")
+
+    def test_sanitize_empty(self):
+        """An empty response stays empty."""
+        assert _sanitize_response("") == ""
+
+
+class TestDellAIClientDelegation:
+    """
+    Tests for DellAIClient methods that only delegate to the sub-modules.
+
+    They share one class-scoped client; keeping them in their own class stops
+    its patched session from reaching the TestDellAIClient tests that send
+    requests through responses.
+    """
+
+    def test_check_model_access_success(self, shared_client, mocker):
+        """Test successful model access check."""
+        mock_check_access = mocker.patch("dell_ai.client.auth.check_model_access")
+        mock_check_access.return_value = True
 
-            client = DellAIClient(token="test-token")
-            result = client.get_platform("platform1")
+        client = shared_client
+        result = client.check_model_access("org/model")
 
-            assert result == mock_platform
-            mock_get_platform.assert_called_once_with(client, "platform1")
+        assert result is True
+        mock_check_access.assert_called_once_with("org/model", "test-token")
 
-    def test_get_deployment_snippet(self):
+    def test_check_model_access_gated_repo(self, shared_client, mocker):
+        """Test model access check for a gated repository."""
+        mock_check_access = mocker.patch("dell_ai.client.auth.check_model_access")
+        mock_check_access.side_effect = GatedRepoAccessError("org/gated-model")
+
+        client = shared_client
+        with pytest.raises(GatedRepoAccessError, match="Access denied") as exc_info:
+            client.check_model_access("org/gated-model")
+
+        assert exc_info.value.model_id == "org/gated-model"
+
+    @pytest.mark.parametrize(
+        "patch_target, client_method, args",
+        [
+            ("dell_ai.models.get_model", "get_model", ("org/model1",)),
+            (
+                "dell_ai.models.get_compatible_platforms",
+                "get_compatible_platforms",
+                ("org/model1",),
+            ),
+            (
+                "dell_ai.models.get_deployment_snippets",
+                "get_deployment_snippets",
+                ([{"model_id": "org/model"}],),
+            ),
+            ("dell_ai.platforms.get_platform", "get_platform", ("platform1",)),
+            ("dell_ai.apps.list_apps", "list_apps", ()),
+            ("dell_ai.apps.get_app", "get_app", ("app1",)),
+            (
+                "dell_ai.apps.get_app_snippet",
+                "get_app_snippet",
+                ("app1", [{"helmPath": "storage.class", "value": "standard"}]),
+            ),
+        ],
+    )
+    def test_delegation(self, shared_client, mocker, patch_target, client_method, args):
+        """Test methods that pass their arguments straight to a sub-module."""
+        mock_function = mocker.patch(patch_target, return_value=sentinel.result)
+
+        result = getattr(shared_client, client_method)(*args)
+
+        assert result is sentinel.result
+        mock_function.assert_called_once_with(shared_client, *args)
+
+    def test_get_models(self, shared_client, mocker):
+        """Test get_models method."""
+        mock_models = [MagicMock(), MagicMock()]
+
+        mock_get_models = mocker.patch("dell_ai.models.get_models")
+        mock_get_models.return_value = mock_models
+
+        client = shared_client
+        result = client.get_models(["org/model1", "org/model2"])
+
+        assert result == mock_models
+        mock_get_models.assert_called_once_with(
+            client, ["org/model1", "org/model2"], skip_missing=False
+        )
+
+    def test_get_deployment_snippet(self, shared_client, mocker):
         """Test get_deployment_snippet method."""
         expected_snippet = "docker run --gpus all registry.huggingface.co/model:latest"
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.models.get_deployment_snippet") as mock_get_snippet,
-        ):
-            mock_get_snippet.return_value = expected_snippet
-
-            client = DellAIClient(token="test-token")
-            result = client.get_deployment_snippet(
-                model_id="org/model",
-                platform_id="platform1",
-                engine="docker",
-                num_gpus=1,
-                num_replicas=1,
-            )
-
-            assert result == expected_snippet
-            mock_get_snippet.assert_called_once_with(
-                client,
-                model_id="org/model",
-                platform_id="platform1",
-                engine="docker",
-                num_gpus=1,
-                num_replicas=1,
-                goodput=None,
-            )
-
-    def test_list_apps(self):
-        """Test list_apps method."""
-        expected_apps = ["app1", "app2"]
-
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.apps.list_apps") as mock_list_apps,
-        ):
-            mock_list_apps.return_value = expected_apps
-
-            client = DellAIClient(token="test-token")
-            result = client.list_apps()
-
-            assert result == expected_apps
-            mock_list_apps.assert_called_once_with(client)
-
-    def test_get_app(self):
-        """Test get_app method."""
-        mock_app = MagicMock()
-
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.apps.get_app") as mock_get_app,
-        ):
-            mock_get_app.return_value = mock_app
-
-            client = DellAIClient(token="test-token")
-            result = client.get_app("app1")
-
-            assert result == mock_app
-            mock_get_app.assert_called_once_with(client, "app1")
-
-    def test_get_app_snippet(self):
-        """Test get_app_snippet method."""
-        expected_snippet = "helm install app1 --set storage.class=standard"
-        config = [{"helmPath": "storage.class", "type": "string", "value": "standard"}]
-
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.apps.get_app_snippet") as mock_get_app_snippet,
-        ):
-            mock_get_app_snippet.return_value = expected_snippet
-
-            client = DellAIClient(token="test-token")
-            result = client.get_app_snippet("app1", config)
-
-            assert result == expected_snippet
-            mock_get_app_snippet.assert_called_once_with(client, "app1", config)
-
-    def test_search_models(self):
+        mock_get_snippet = mocker.patch("dell_ai.models.get_deployment_snippet")
+        mock_get_snippet.return_value = expected_snippet
+
+        client = shared_client
+        result = client.get_deployment_snippet(
+            model_id="org/model",
+            platform_id="platform1",
+            engine="docker",
+            num_gpus=1,
+            num_replicas=1,
+        )
+
+        assert result == expected_snippet
+        mock_get_snippet.assert_called_once_with(
+            client,
+            model_id="org/model",
+            platform_id="platform1",
+            engine="docker",
+            num_gpus=1,
+            num_replicas=1,
+            goodput=None,
+        )
+
+    def test_snippet_session(self, shared_client, mocker):
+        """Test snippet_session method."""
+        mock_session_class = mocker.patch("dell_ai.models.SnippetSession")
+        client = shared_client
+        result = client.snippet_session("org/model", "platform1", "docker")
+
+        assert result is mock_session_class.return_value
+        mock_session_class.assert_called_once_with(
+            client, "org/model", "platform1", "docker"
+        )
+
+    def test_search_models(self, shared_client, mocker):
         """Test search_models method."""
         mock_results = [MagicMock(), MagicMock()]
 
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.models.search_models") as mock_search_models,
-        ):
-            mock_search_models.return_value = mock_results
-
-            client = DellAIClient(token="test-token")
-            result = client.search_models(
-                query="gemma",
-                multimodal=True,
-                min_size=1000,
-                max_size=50000,
-                license_filter="apache",
-                platform_id="xe9680-nvidia-h100",
-            )
-
-            assert result == mock_results
-            mock_search_models.assert_called_once_with(
-                client,
-                query="gemma",
-                multimodal=True,
-                min_size=1000,
-                max_size=50000,
-                license_filter="apache",
-                platform_id="xe9680-nvidia-h100",
-            )
-
-    def test_get_compatible_platforms(self):
-        """Test get_compatible_platforms method."""
-        mock_results = [MagicMock(), MagicMock()]
-
-        with (
-            patch("dell_ai.client.requests.Session"),
-            patch("dell_ai.client.auth.validate_token", return_value=True),
-            patch("dell_ai.models.get_compatible_platforms") as mock_get_compat,
-        ):
-            mock_get_compat.return_value = mock_results
-
-            client = DellAIClient(token="test-token")
-            result = client.get_compatible_platforms("org/model1")
-
-            assert result == mock_results
-            mock_get_compat.assert_called_once_with(client, "org/model1")
+        mock_search_models = mocker.patch("dell_ai.models.search_models")
+        mock_search_models.return_value = mock_results
+
+        client = shared_client
+        result = client.search_models(
+            query="gemma",
+            multimodal=True,
+            min_size=1000,
+            max_size=50000,
+            license_filter="apache",
+            platform_id="xe9680-nvidia-h100",
+            expand=True,
+        )
+
+        assert result == mock_results
+        mock_search_models.assert_called_once_with(
+            client,
+            query="gemma",
+            multimodal=True,
+            min_size=1000,
+            max_size=50000,
+            license_filter="apache",
+            platform_id="xe9680-nvidia-h100",
+            expand=True,
+        )
@@ -1,15 +1,25 @@
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
 
+from dell_ai import client as client_module
 from dell_ai import constants
+from dell_ai.client import DellAIClient
 from dell_ai.exceptions import (
+    APIError,
     DellAIError,
     GatedRepoAccessError,
     ResourceNotFoundError,
     ValidationError,
 )
-from dell_ai.models import SnippetRequest, SnippetResponse, get_deployment_snippet
+from dell_ai.models import (
+    Model,
+    SnippetRequest,
+    SnippetResponse,
+    SnippetSession,
+    get_deployment_snippet,
+    get_deployment_snippets,
+)
 
 # Real-world example snippets
 LLAMA_MAVERICK_DOCKER_SNIPPET = """docker run \\
@@ -82,104 +92,78 @@ spec:
 
 
 @pytest.fixture
-def mock_client(tmp_path, monkeypatch):
+def mock_client(module_mock_client, tmp_path, monkeypatch):
     monkeypatch.setattr(constants, "MODEL_CACHE_DIR", tmp_path)
-    client = MagicMock()
-    return client
+    module_mock_client.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(module_mock_client, "_cache", {})
+    return module_mock_client
 
 
-def test_get_deployment_snippet_docker(mock_client):
-    """Test successful retrieval of Docker deployment snippet with real-world example"""
-    # Mock the model response
-    mock_client._make_request.side_effect = [
-        {
-            "repoName": "meta-llama/Llama-4-Maverick-17B-128E-Instruct",
-            "configsDeploy": {
-                "containerTags": {
-                    "nvidia": [
-                        {"id": "latest", "contains_weights": False},
-                    ],
-                    "amd": [
-                        {"id": "latest", "contains_weights": False},
-                    ],
-                },
-                "configPerSku": {
-                    "xe9680-amd-mi300x": [
-                        {
-                            "max_batch_prefill_tokens": 16484,
-                            "max_input_tokens": 16383,
-                            "max_total_tokens": 16384,
-                            "num_gpus": 8,
-                        }
-                    ]
-                },
-            },
-        },
-        {
-            "snippet": LLAMA_MAVERICK_DOCKER_SNIPPET,
-            "engine": "docker",
-        },
-    ]
+def _route_requests(mock_client, model_details, snippet_response):
+    """Answer model and snippet requests by path."""
 
-    result = get_deployment_snippet(
-        client=mock_client,
-        model_id="meta-llama/Llama-4-Maverick-17B-128E-Instruct",
-        platform_id="xe9680-amd-mi300x",
-        engine="docker",
-        num_gpus=8,
-        num_replicas=1,
-    )
+    def _dispatch(method, path, *args, **kwargs):
+        if path.startswith(constants.SNIPPETS_ENDPOINT):
+            return snippet_response
+        return model_details
 
-    assert isinstance(result, str)
-    assert result == LLAMA_MAVERICK_DOCKER_SNIPPET
-    assert mock_client._make_request.call_count == 2
+    mock_client._make_request.side_effect = _dispatch
 
 
-def test_get_deployment_snippet_kubernetes(mock_client):
-    """Test successful retrieval of Kubernetes deployment snippet with real-world example"""
-    # Mock the model response
-    mock_client._make_request.side_effect = [
-        {
-            "repoName": "meta-llama/Llama-4-Maverick-17B-128E-Instruct",
-            "configsDeploy": {
-                "containerTags": {
-                    "nvidia": [
-                        {"id": "latest", "contains_weights": False},
-                    ],
-                    "amd": [
-                        {"id": "latest", "contains_weights": False},
-                    ],
-                },
-                "configPerSku": {
-                    "xe9680-amd-mi300x": [
-                        {
-                            "max_batch_prefill_tokens": 16484,
-                            "max_input_tokens": 16383,
-                            "max_total_tokens": 16384,
-                            "num_gpus": 8,
-                        }
-                    ]
-                },
-            },
+LLAMA_MAVERICK_MODEL_DETAILS = {
+    "repoName": "meta-llama/Llama-4-Maverick-17B-128E-Instruct",
+    "configsDeploy": {
+        "containerTags": {
+            "nvidia": [
+                {"id": "latest", "contains_weights": False},
+            ],
+            "amd": [
+                {"id": "latest", "contains_weights": False},
+            ],
         },
-        {
-            "snippet": LLAMA_MAVERICK_K8S_SNIPPET,
-            "engine": "kubernetes",
+        "configPerSku": {
+            "xe9680-amd-mi300x": [
+                {
+                    "max_batch_prefill_tokens": 16484,
+                    "max_input_tokens": 16383,
+                    "max_total_tokens": 16384,
+                    "num_gpus": 8,
+                }
+            ]
         },
-    ]
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "engine, snippet",
+    [
+        ("docker", LLAMA_MAVERICK_DOCKER_SNIPPET),
+        ("kubernetes", LLAMA_MAVERICK_K8S_SNIPPET),
+    ],
+    ids=["docker", "kubernetes"],
+)
+def test_get_deployment_snippet(mock_client, engine, snippet):
+    """Test successful retrieval of deployment snippets with real-world examples"""
+    _route_requests(
+        mock_client,
+        LLAMA_MAVERICK_MODEL_DETAILS,
+        {"snippet": snippet, "engine": engine},
+    )
 
     result = get_deployment_snippet(
         client=mock_client,
         model_id="meta-llama/Llama-4-Maverick-17B-128E-Instruct",
         platform_id="xe9680-amd-mi300x",
-        engine="kubernetes",
+        engine=engine,
         num_gpus=8,
         num_replicas=1,
     )
 
     assert isinstance(result, str)
-    assert result == LLAMA_MAVERICK_K8S_SNIPPET
-    assert mock_client._make_request.call_count == 2
+    assert result == snippet
+    # A served snippet needs no model fetch for validation
+    assert mock_client._make_request.call_count == 1
 
 
 def test_get_deployment_snippet_error_handling(mock_client):
@@ -240,7 +224,8 @@ def test_get_deployment_snippet_checks_access_before_proceeding(mock_client):
     mock_client.check_model_access.return_value = True
 
     # Mock the model response for validation
-    mock_client._make_request.side_effect = [
+    _route_requests(
+        mock_client,
         {
             "repoName": "test-org/test-model",
             "configsDeploy": {
@@ -268,7 +253,7 @@ def test_get_deployment_snippet_checks_access_before_proceeding(mock_client):
             "snippet": "docker run test-image",
             "engine": "docker",
         },
-    ]
+    )
 
     result = get_deployment_snippet(
         client=mock_client,
@@ -282,42 +267,39 @@ def test_get_deployment_snippet_checks_access_before_proceeding(mock_client):
     # Verify access was checked first
     mock_client.check_model_access.assert_called_once_with("test-org/test-model")
 
-    # Verify the model validation and API calls happened after access check
-    assert mock_client._make_request.call_count == 2
+    # Verify the snippet request happened after the access check
+    assert mock_client._make_request.call_count == 1
     assert result == "docker run test-image"
 
 
+MOCK_SNIPPET_REQUEST = {
+    "model_id": "meta-llama/Llama-4-Maverick-17B-128E-Instruct",
+    "platform_id": "xe9680-amd-mi300x",
+    "engine": "docker",
+    "num_gpus": 8,
+    "num_replicas": 1,
+}
+
+
 def test_snippet_request_validation():
     """Test SnippetRequest validation with real-world values"""
-    # Test valid request
-    request = SnippetRequest(
-        model_id="meta-llama/Llama-4-Maverick-17B-128E-Instruct",
-        platform_id="xe9680-amd-mi300x",
-        engine="docker",
-        num_gpus=8,
-        num_replicas=1,
-    )
+    request = SnippetRequest(**MOCK_SNIPPET_REQUEST)
     assert request.model_id == "meta-llama/Llama-4-Maverick-17B-128E-Instruct"
     assert request.num_gpus == 8
 
-    # Test invalid values
-    with pytest.raises(ValueError):
-        SnippetRequest(
-            model_id="meta-llama/Llama-4-Maverick-17B-128E-Instruct",
-            platform_id="xe9680-amd-mi300x",
-            engine="invalid",
-            num_gpus=8,
-            num_replicas=1,
-        )
 
+@pytest.mark.parametrize(
+    "invalid_data",
+    [
+        {**MOCK_SNIPPET_REQUEST, "engine": "invalid"},
+        {**MOCK_SNIPPET_REQUEST, "num_gpus": 0},
+    ],
+    ids=["invalid-engine", "zero-gpus"],
+)
+def test_snippet_request_validation_rejects(invalid_data):
+    """Test that SnippetRequest validation rejects invalid values."""
     with pytest.raises(ValueError):
-        SnippetRequest(
-            model_id="meta-llama/Llama-4-Maverick-17B-128E-Instruct",
-            platform_id="xe9680-amd-mi300x",
-            engine="docker",
-            num_gpus=0,
-            num_replicas=1,
-        )
+        SnippetRequest(**invalid_data)
 
 
 def test_snippet_response_validation():
@@ -383,6 +365,7 @@ def test_get_deployment_snippet_goodput(mock_client):
     params = mock_client._make_request.call_args.kwargs["params"]
     assert params["goodput"] == "balanced"
     assert "gpus" not in params
+    assert mock_client._make_request.call_args.kwargs["stream_key"] == "snippet"
 
     # Access is still checked.
     mock_client.check_model_access.assert_called_once_with("google/gemma-3-27b-it")
@@ -406,3 +389,363 @@ def test_get_deployment_snippet_goodput_unavailable(mock_client):
 
     # The unhelpful endpoint-derived default is not used.
     assert str(exc_info.value) == api_message
+
+
+def test_get_deployment_snippet_normalizes_engine(mock_client):
+    """The validated, lower-cased engine is what gets sent to the API."""
+    mock_client._make_request.return_value = {"snippet": "docker run"}
+
+    get_deployment_snippet(
+        client=mock_client,
+        model_id="google/gemma-3-27b-it",
+        platform_id="xe9680-nvidia-h100",
+        engine="Docker",
+        goodput="balanced",
+    )
+
+    params = mock_client._make_request.call_args.kwargs["params"]
+    assert params["container"] == "docker"
+
+
+def test_get_deployment_snippet_encodes_path(mock_client):
+    """Creator and model names are URL-encoded in the snippet path."""
+    mock_client._make_request.return_value = {"snippet": "docker run"}
+
+    get_deployment_snippet(
+        client=mock_client,
+        model_id="my+org/model #1",
+        platform_id="xe9680-nvidia-h100",
+        engine="docker",
+        goodput="balanced",
+    )
+
+    path = mock_client._make_request.call_args.args[1]
+    assert path == "/snippets/models/my%2Borg/model%20%231/deploy"
+
+
+def test_get_deployment_snippet_invalid_response(mock_client):
+    """A non-string snippet in the response is reported as an API error."""
+    mock_client._make_request.return_value = {"snippet": {"unexpected": True}}
+
+    with pytest.raises(APIError, match="Invalid snippet"):
+        get_deployment_snippet(
+            client=mock_client,
+            model_id="google/gemma-3-27b-it",
+            platform_id="xe9680-nvidia-h100",
+            engine="docker",
+            goodput="balanced",
+        )
+
+
+def test_get_deployment_snippets_preserves_order(mock_client):
+    """Batch results line up with the input configurations."""
+
+    def _dispatch(method, path, params=None, **kwargs):
+        return {"snippet": f"{params['container']} {params['sku']}"}
+
+    mock_client._make_request.side_effect = _dispatch
+    configs = [
+        SnippetRequest(
+            model_id="google/gemma-3-27b-it",
+            platform_id=f"sku-{i}",
+            engine="docker" if i % 2 else "kubernetes",
+            num_replicas=1,
+            goodput="balanced",
+        )
+        for i in range(5)
+    ]
+    configs.append(
+        {
+            "model_id": "google/gemma-3-27b-it",
+            "platform_id": "sku-5",
+            "engine": "docker",
+            "num_replicas": 1,
+            "goodput": "balanced",
+        }
+    )
+
+    results = get_deployment_snippets(mock_client, configs)
+
+    assert results == [
+        "kubernetes sku-0",
+        "docker sku-1",
+        "kubernetes sku-2",
+        "docker sku-3",
+        "kubernetes sku-4",
+        "docker sku-5",
+    ]
+    assert mock_client._make_request.call_count == 6
+
+
+def test_get_deployment_snippets_validates_whole_batch_first(mock_client):
+    """An invalid entry fails the batch before any request is sent."""
+    configs = [
+        {
+            "model_id": "google/gemma-3-27b-it",
+            "platform_id": "xe9680-nvidia-h100",
+            "engine": "docker",
+            "num_gpus": 1,
+            "num_replicas": 1,
+        },
+        {
+            "model_id": "google/gemma-3-27b-it",
+            "platform_id": "xe9680-nvidia-h100",
+            "engine": "podman",
+            "num_gpus": 1,
+            "num_replicas": 1,
+        },
+    ]
+
+    with pytest.raises(ValidationError, match="engine"):
+        get_deployment_snippets(mock_client, configs)
+
+    mock_client._make_request.assert_not_called()
+    mock_client.check_model_access.assert_not_called()
+
+
+def test_schema_error_reports_field(mock_client):
+    """A single invalid field is named along with its valid values."""
+    with pytest.raises(ValidationError, match="Invalid engine") as exc_info:
+        get_deployment_snippet(
+            mock_client, "google/gemma-3-27b-it", "xe9680", "podman", num_gpus=1
+        )
+
+    assert exc_info.value.parameter == "engine"
+    assert exc_info.value.valid_values == ["docker", "kubernetes"]
+    mock_client._make_request.assert_not_called()
+
+
+def test_schema_error_reports_every_field(mock_client):
+    """Several invalid fields are reported together, one per line."""
+    with pytest.raises(ValidationError) as exc_info:
+        get_deployment_snippet(
+            mock_client, "gemma", "xe9680", "podman", num_gpus=0, num_replicas=0
+        )
+
+    lines = str(exc_info.value).splitlines()
+    assert lines[0].startswith("Invalid model ID")
+    assert lines[1].startswith("Invalid engine")
+    assert lines[2].startswith("Invalid number of GPUs")
+    assert lines[3].startswith("Invalid number of replicas")
+    assert exc_info.value.parameter is None
+
+
+def test_get_deployment_snippets_reports_config_index(mock_client):
+    """Batch validation errors name the offending config."""
+    configs = [
+        {"model_id": "google/gemma-3-27b-it", "platform_id": "xe9680", "num_gpus": 1},
+    ]
+
+    with pytest.raises(
+        ValidationError, match="Config 0: Missing required field 'engine'"
+    ):
+        get_deployment_snippets(mock_client, configs)
+
+
+def test_get_deployment_snippets_empty(mock_client):
+    """An empty batch returns an empty list without touching the API."""
+    assert get_deployment_snippets(mock_client, []) == []
+    mock_client._make_request.assert_not_called()
+
+
+def test_compatibility_verdict_is_memoized(mock_client):
+    """Each (model, platform, GPUs) configuration is validated once per client."""
+
+    def _dispatch(method, path, **kwargs):
+        if kwargs["params"]["gpus"] == 4:
+            raise ResourceNotFoundError("snippets", "deploy")
+        return {"snippet": kwargs["params"]["container"]}
+
+    mock_client._make_request.side_effect = _dispatch
+    model = Model(
+        repoName="google/gemma-3-27b-it",
+        configsDeploy={
+            "configPerSku": {
+                "xe9680-nvidia-h100": [
+                    {"num_gpus": 2, "max_input_tokens": 8000, "max_total_tokens": 8192}
+                ]
+            }
+        },
+    )
+
+    with patch("dell_ai.models.get_model", return_value=model) as mock_get_model:
+        for engine in ("docker", "kubernetes"):
+            get_deployment_snippet(
+                mock_client,
+                "google/gemma-3-27b-it",
+                "xe9680-nvidia-h100",
+                engine,
+                num_gpus=2,
+            )
+        errors = []
+        for engine in ("docker", "kubernetes"):
+            with pytest.raises(ValidationError, match="Invalid number of GPUs") as e:
+                get_deployment_snippet(
+                    mock_client,
+                    "google/gemma-3-27b-it",
+                    "xe9680-nvidia-h100",
+                    engine,
+                    num_gpus=4,
+                )
+            errors.append(e.value)
+
+    # Only the failing num_gpus=4 configuration is validated, and only once
+    assert mock_get_model.call_count == 1
+    # Each call raises its own error built from the memoized verdict
+    assert errors[0] is not errors[1]
+    assert errors[1].parameter == "num_gpus"
+    assert errors[1].valid_values == [2]
+
+
+def test_validation_error_wins_over_rejected_request(mock_client):
+    """A failed compatibility check is raised in place of the API's 400 error."""
+    mock_client._make_request.side_effect = ValidationError("Invalid request")
+    model = Model(
+        repoName="google/gemma-3-27b-it",
+        configsDeploy={
+            "configPerSku": {
+                "xe9680-nvidia-h100": [
+                    {"num_gpus": 2, "max_input_tokens": 8000, "max_total_tokens": 8192}
+                ]
+            }
+        },
+    )
+
+    with patch("dell_ai.models.get_model", return_value=model):
+        with pytest.raises(ValidationError, match="Invalid number of GPUs"):
+            get_deployment_snippet(
+                mock_client,
+                "google/gemma-3-27b-it",
+                "xe9680-nvidia-h100",
+                "docker",
+                num_gpus=4,
+            )
+
+
+def test_server_error_skips_compatibility_check(mock_client):
+    """A 5xx from the snippet endpoint is raised as-is without fetching the model."""
+    server_error = APIError("Internal server error", status_code=500)
+    mock_client._make_request.side_effect = server_error
+
+    with patch("dell_ai.models.get_model") as mock_get_model:
+        with pytest.raises(APIError) as exc_info:
+            get_deployment_snippet(
+                mock_client,
+                "google/gemma-3-27b-it",
+                "xe9680-nvidia-h100",
+                "docker",
+                num_gpus=4,
+            )
+
+    assert exc_info.value is server_error
+    mock_get_model.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [b"Transfer-Encoding: chunked\r\n", b"Content-Length: 1048576\r\n"],
+    ids=["chunked", "large"],
+)
+def test_snippet_truncated_stream(truncated_server, mocker, headers):
+    """A snippet body cut off while it is streamed raises APIError."""
+    if client_module.ijson is None:
+        pytest.skip("ijson is not installed")
+    mocker.patch("dell_ai.client.auth.validate_token", return_value=True)
+    body = b'{"snippet": "docker run'
+    if headers.startswith(b"Transfer-Encoding"):
+        body = b"%x\r\n" % 64 + body
+    mocker.patch.object(DellAIClient, "check_model_access", return_value=True)
+    client = DellAIClient(token="test-token")
+    client.base_url = truncated_server(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        + headers
+        + b"\r\n"
+        + body
+    )
+
+    with pytest.raises(APIError, match="Request failed"):
+        get_deployment_snippet(
+            client,
+            "google/gemma-3-27b-it",
+            "xe9680-nvidia-h100",
+            "docker",
+            num_gpus=1,
+        )
+
+
+@pytest.mark.parametrize(
+    "model_id", ["gemma", "google/", "/gemma", "google/gemma/extra", ""]
+)
+def test_snippet_request_rejects_malformed_model_id(model_id):
+    """Model IDs without exactly one creator and one model name are rejected."""
+    with pytest.raises(ValueError, match="model_id"):
+        SnippetRequest(
+            model_id=model_id,
+            platform_id="xe9680-nvidia-h100",
+            engine="docker",
+            num_gpus=1,
+            num_replicas=1,
+        )
+
+
+def test_snippet_request_normalizes_engine():
+    """The engine is lower-cased before it is checked against the valid values."""
+    request = SnippetRequest(
+        model_id="google/gemma-3-27b-it",
+        platform_id="xe9680-nvidia-h100",
+        engine="KUBERNETES",
+        num_gpus=1,
+        num_replicas=1,
+    )
+    assert request.engine == "kubernetes"
+
+
+def test_snippet_session_generates_sizes(mock_client):
+    """A session checks access once and only varies the GPU and replica counts."""
+    mock_client._make_request.side_effect = lambda method, path, **kwargs: {
+        "snippet": f"gpus={kwargs['params']['gpus']} "
+        f"replicas={kwargs['params']['replicas']}"
+    }
+    model = Model(
+        repoName="google/gemma-3-27b-it",
+        configsDeploy={
+            "configPerSku": {
+                "xe9680-nvidia-h100": [
+                    {"num_gpus": 2, "max_input_tokens": 8000, "max_total_tokens": 8192},
+                    {"num_gpus": 4, "max_input_tokens": 8000, "max_total_tokens": 8192},
+                ]
+            }
+        },
+    )
+
+    with patch("dell_ai.models.get_model", return_value=model):
+        session = SnippetSession(
+            mock_client, "google/gemma-3-27b-it", "xe9680-nvidia-h100", "Docker"
+        )
+        assert session.generate(2) == "gpus=2 replicas=1"
+        assert session.generate(4, num_replicas=3) == "gpus=4 replicas=3"
+        # Repeated sizes are answered without another request
+        assert session.generate(2) == "gpus=2 replicas=1"
+
+    mock_client.check_model_access.assert_called_once_with("google/gemma-3-27b-it")
+    assert mock_client._make_request.call_count == 2
+    _, kwargs = mock_client._make_request.call_args
+    assert kwargs["params"] == {
+        "sku": "xe9680-nvidia-h100",
+        "container": "docker",
+        "gpus": 4,
+        "replicas": 3,
+    }
+
+
+def test_snippet_session_validates(mock_client):
+    """Invalid fixed fields fail at creation, invalid sizes before any request."""
+    with pytest.raises(ValidationError):
+        SnippetSession(mock_client, "google/gemma-3-27b-it", "xe9680", "podman")
+
+    session = SnippetSession(mock_client, "google/gemma-3-27b-it", "xe9680", "docker")
+    with pytest.raises(ValidationError):
+        session.generate(0)
+
+    mock_client.check_model_access.assert_not_called()
+    mock_client._make_request.assert_not_called()
@@ -1,6 +1,6 @@
 import json
 import time
-from unittest.mock import MagicMock, call
+from unittest.mock import call
 
 import pytest
 
@@ -9,9 +9,12 @@ from dell_ai.exceptions import ResourceNotFoundError, ValidationError
 from dell_ai.models import (
     Model,
     ModelConfig,
+    ModelDeployConfigs,
     PlatformCompatibility,
+    _handle_resource_not_found,
     get_compatible_platforms,
     get_model,
+    get_models,
     list_models,
     search_models,
 )
@@ -24,59 +27,19 @@ MOCK_MODELS_LIST = [
     "google/gemma-3-12b-it",
 ]
 
-MOCK_MODEL_DETAILS = {
-    "repo_name": "google/gemma-3-27b-it",
-    "description": "Gemma is a family of lightweight, state-of-the-art open models from Google, built from the same research and technology used to create the Gemini models.",
-    "license": "gemma",
-    "creator_type": "org",
-    "size": 27400,
-    "has_system_prompt": True,
-    "is_multimodal": True,
-    "status": "new",
-    "configsDeploy": {
-        "containerTags": {
-            "nvidia": [
-                {"id": "latest", "contains_weights": False},
-            ],
-            "amd": [
-                {"id": "latest", "contains_weights": False},
-            ],
-        },
-        "configPerSku": {
-            "xe9680-nvidia-h100": [
-                {
-                    "max_batch_prefill_tokens": 16000,
-                    "max_input_tokens": 8000,
-                    "max_total_tokens": 8192,
-                    "num_gpus": 2,
-                }
-            ],
-            "xe8640-nvidia-h100": [
-                {
-                    "max_batch_prefill_tokens": 16000,
-                    "max_input_tokens": 8000,
-                    "max_total_tokens": 8192,
-                    "num_gpus": 2,
-                }
-            ],
-            "r760xa-nvidia-h100": [
-                {
-                    "max_batch_prefill_tokens": 16000,
-                    "max_input_tokens": 8000,
-                    "max_total_tokens": 8192,
-                    "num_gpus": 2,
-                }
-            ],
-        },
-    },
-}
+
+@pytest.fixture
+def model_details(load_resource):
+    """Fixture that provides a fresh copy of the gemma model details payload."""
+    return load_resource("model_details.json")
 
 
 @pytest.fixture
-def mock_client(tmp_path, monkeypatch):
-    """Fixture that provides a mock Dell AI client."""
+def mock_client(module_mock_client, tmp_path, monkeypatch):
+    """Fixture that provides a freshly reset mock Dell AI client."""
     monkeypatch.setattr(constants, "MODEL_CACHE_DIR", tmp_path)
-    return MagicMock()
+    module_mock_client.reset_mock(return_value=True, side_effect=True)
+    return module_mock_client
 
 
 def test_list_models(mock_client):
@@ -87,9 +50,9 @@ def test_list_models(mock_client):
     mock_client._make_request.assert_called_once()
 
 
-def test_get_model(mock_client):
+def test_get_model(mock_client, model_details):
     """Test that get_model returns a properly constructed Model object."""
-    mock_client._make_request.return_value = MOCK_MODEL_DETAILS
+    mock_client._make_request.return_value = model_details
     model = get_model(mock_client, "google/gemma-3-27b-it")
 
     assert isinstance(model, Model)
@@ -117,11 +80,11 @@ def test_get_model(mock_client):
     assert config.num_gpus == 2
 
 
-def test_get_model_uses_fresh_file_cache(mock_client):
+def test_get_model_uses_fresh_file_cache(mock_client, model_details):
     """Test that get_model reads fresh model details from the file cache."""
     cache_path = constants.MODEL_CACHE_DIR / "google--gemma-3-27b-it.json"
     cache_path.write_text(
-        json.dumps({"retrieved_at": time.time(), "model": MOCK_MODEL_DETAILS}),
+        json.dumps({"retrieved_at": time.time(), "model": model_details}),
         encoding="utf-8",
     )
 
@@ -131,7 +94,9 @@ def test_get_model_uses_fresh_file_cache(mock_client):
     mock_client._make_request.assert_not_called()
 
 
-def test_get_model_refreshes_expired_file_cache(mock_client, monkeypatch):
+def test_get_model_refreshes_expired_file_cache(
+    mock_client, monkeypatch, model_details
+):
     """Test that get_model ignores expired model cache entries."""
     monkeypatch.setattr(constants, "MODEL_CACHE_TTL_SECONDS", 60)
     cache_path = constants.MODEL_CACHE_DIR / "google--gemma-3-27b-it.json"
@@ -140,18 +105,18 @@ def test_get_model_refreshes_expired_file_cache(mock_client, monkeypatch):
             {
                 "retrieved_at": time.time() - 120,
                 "model": {
-                    **MOCK_MODEL_DETAILS,
+                    **model_details,
                     "description": "Expired cached description",
                 },
             }
         ),
         encoding="utf-8",
     )
-    mock_client._make_request.return_value = MOCK_MODEL_DETAILS
+    mock_client._make_request.return_value = model_details
 
     model = get_model(mock_client, "google/gemma-3-27b-it")
 
-    assert model.description == MOCK_MODEL_DETAILS["description"]
+    assert model.description == model_details["description"]
     mock_client._make_request.assert_called_once_with(
         "GET", "/models/google/gemma-3-27b-it"
     )
@@ -166,38 +131,39 @@ def test_get_model_not_found(mock_client):
         get_model(mock_client, "google/nonexistent-model")
 
 
-def test_model_validation():
-    """Test that Model validation works correctly for both valid and invalid data."""
-    # Test valid model data
-    model = Model(**MOCK_MODEL_DETAILS)
+def test_model_validation(model_details):
+    """Test that Model validation accepts valid data."""
+    model = Model(**model_details)
     assert model.repo_name == "google/gemma-3-27b-it"
 
-    # Test invalid model data
+
+def test_model_validation_rejects_non_numeric_size(model_details):
+    """Test that Model validation rejects a size that is not a number."""
     with pytest.raises(ValueError):
-        Model(**{**MOCK_MODEL_DETAILS, "size": "not a number"})
+        Model(**{**model_details, "size": "not a number"})
+
+
+MOCK_MODEL_CONFIG = {
+    "engine": "docker",
+    "model_id": "google/gemma-3-27b-it",
+    "max_batch_prefill_tokens": 2048,
+    "max_input_tokens": 4096,
+    "max_total_tokens": 4096,
+    "num_gpus": 1,
+}
 
 
 def test_model_config_validation():
     """Test ModelConfig Pydantic model validation"""
-    # Test valid config data
-    config_data = {
-        "engine": "docker",
-        "model_id": "google/gemma-3-27b-it",
-        "max_batch_prefill_tokens": 2048,
-        "max_input_tokens": 4096,
-        "max_total_tokens": 4096,
-        "num_gpus": 1,
-    }
-    config = ModelConfig(**config_data)
+    config = ModelConfig(**MOCK_MODEL_CONFIG)
     assert config.max_batch_prefill_tokens == 2048
     assert config.num_gpus == 1
 
-    # Test invalid config data
-    invalid_data = config_data.copy()
-    invalid_data["model_id"] = 1234  # set to invalid type instead of string.
 
+def test_model_config_validation_rejects_non_string_model_id():
+    """Test that ModelConfig validation rejects a model_id that is not a string."""
     with pytest.raises(ValueError):
-        ModelConfig(**invalid_data)
+        ModelConfig(**{**MOCK_MODEL_CONFIG, "model_id": 1234})
 
 
 # Search models tests
@@ -220,7 +186,7 @@ MOCK_MODEL_DETAILS_LLAMA = {
 }
 
 
-def _setup_search_mock(mock_client, model_ids):
+def _setup_search_mock(mock_client, model_details, model_ids):
     """Wire mock_client._make_request to dispatch on endpoint URL.
 
     search_models fetches model details in parallel, so an ordered side_effect
@@ -228,7 +194,7 @@ def _setup_search_mock(mock_client, model_ids):
     endpoint keeps the test deterministic regardless of completion order.
     """
     details_by_id = {
-        "google/gemma-3-27b-it": MOCK_MODEL_DETAILS,
+        "google/gemma-3-27b-it": model_details,
         "meta-llama/Llama-4-Maverick-17B-128E-Instruct": MOCK_MODEL_DETAILS_LLAMA,
     }
 
@@ -248,110 +214,169 @@ _BOTH_MODELS = [
 ]
 
 
-def test_search_models_by_query(mock_client):
+def test_search_models_by_query(mock_client, model_details):
     """Test searching models by query string."""
-    _setup_search_mock(mock_client, ["google/gemma-3-27b-it"])
+    _setup_search_mock(mock_client, model_details, ["google/gemma-3-27b-it"])
     results = search_models(mock_client, query="gemma")
     assert len(results) == 1
     assert results[0].repo_name == "google/gemma-3-27b-it"
     assert (
-        call("GET", "/models", params={"query": "gemma"})
+        call(
+            "GET",
+            "/models",
+            params={"query": "gemma"},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_by_multimodal(mock_client):
+def test_search_models_by_multimodal(mock_client, model_details):
     """Test searching models by multimodal filter."""
-    _setup_search_mock(mock_client, ["google/gemma-3-27b-it"])
+    _setup_search_mock(mock_client, model_details, ["google/gemma-3-27b-it"])
     results = search_models(mock_client, multimodal=True)
     assert len(results) == 1
     assert results[0].is_multimodal is True
     assert (
-        call("GET", "/models", params={"multimodal": True})
+        call(
+            "GET",
+            "/models",
+            params={"multimodal": True},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_by_size(mock_client):
+def test_search_models_by_size(mock_client, model_details):
     """Test searching models by min size filter."""
-    _setup_search_mock(mock_client, ["google/gemma-3-27b-it"])
+    _setup_search_mock(mock_client, model_details, ["google/gemma-3-27b-it"])
     results = search_models(mock_client, min_size=20000)
     assert len(results) == 1
     assert results[0].repo_name == "google/gemma-3-27b-it"
     assert (
-        call("GET", "/models", params={"min-size": 20000})
+        call(
+            "GET",
+            "/models",
+            params={"min-size": 20000},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_by_max_size(mock_client):
+def test_search_models_by_max_size(mock_client, model_details):
     """Test searching models by max size filter."""
-    _setup_search_mock(mock_client, ["meta-llama/Llama-4-Maverick-17B-128E-Instruct"])
+    _setup_search_mock(
+        mock_client, model_details, ["meta-llama/Llama-4-Maverick-17B-128E-Instruct"]
+    )
     results = search_models(mock_client, max_size=20000)
     assert len(results) == 1
     assert results[0].repo_name == "meta-llama/Llama-4-Maverick-17B-128E-Instruct"
     assert (
-        call("GET", "/models", params={"max-size": 20000})
+        call(
+            "GET",
+            "/models",
+            params={"max-size": 20000},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_by_license(mock_client):
+def test_search_models_by_license(mock_client, model_details):
     """Test searching models by license filter."""
-    _setup_search_mock(mock_client, ["google/gemma-3-27b-it"])
+    _setup_search_mock(mock_client, model_details, ["google/gemma-3-27b-it"])
     results = search_models(mock_client, license_filter="gemma")
     assert len(results) == 1
     assert results[0].license == "gemma"
     assert (
-        call("GET", "/models", params={"license": "gemma"})
+        call(
+            "GET",
+            "/models",
+            params={"license": "gemma"},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_by_platform(mock_client):
+def test_search_models_by_platform(mock_client, model_details):
     """Test searching models by platform filter."""
-    _setup_search_mock(mock_client, _BOTH_MODELS)
+    _setup_search_mock(mock_client, model_details, _BOTH_MODELS)
     results = search_models(mock_client, platform_id="xe9680-nvidia-h100")
     assert len(results) == 2
     assert (
-        call("GET", "/models", params={"platform-id": "xe9680-nvidia-h100"})
+        call(
+            "GET",
+            "/models",
+            params={"platform-id": "xe9680-nvidia-h100"},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_combined_filters(mock_client):
+def test_search_models_combined_filters(mock_client, model_details):
     """Test searching models by combined filters."""
-    _setup_search_mock(mock_client, ["google/gemma-3-27b-it"])
+    _setup_search_mock(mock_client, model_details, ["google/gemma-3-27b-it"])
     results = search_models(mock_client, multimodal=True, min_size=20000)
     assert len(results) == 1
     assert results[0].repo_name == "google/gemma-3-27b-it"
     assert (
-        call("GET", "/models", params={"multimodal": True, "min-size": 20000})
+        call(
+            "GET",
+            "/models",
+            params={"multimodal": True, "min-size": 20000},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_no_results(mock_client):
+def test_search_models_no_results(mock_client, model_details):
     """Test no matching search results."""
-    _setup_search_mock(mock_client, [])
+    _setup_search_mock(mock_client, model_details, [])
     results = search_models(mock_client, query="nonexistent-model")
     assert len(results) == 0
     assert (
-        call("GET", "/models", params={"query": "nonexistent-model"})
+        call(
+            "GET",
+            "/models",
+            params={"query": "nonexistent-model"},
+            stream_key="models",
+        )
         in mock_client._make_request.mock_calls
     )
 
 
-def test_search_models_no_filters(mock_client):
+def test_search_models_no_filters(mock_client, model_details):
     """Test search with no filters returns all models."""
-    _setup_search_mock(mock_client, _BOTH_MODELS)
+    _setup_search_mock(mock_client, model_details, _BOTH_MODELS)
     results = search_models(mock_client)
     assert len(results) == 2
 
 
-def test_search_models_uses_cache_on_second_call(mock_client):
+def test_search_models_expanded_details(mock_client, model_details):
+    """Inline details from an expanded listing need no per-model requests."""
+    mock_client._make_request.return_value = {
+        "models": [MOCK_MODEL_DETAILS_LLAMA, model_details, {"bad": "entry"}]
+    }
+
+    results = search_models(mock_client, expand=True)
+
+    assert [model.repo_name for model in results] == [
+        "meta-llama/Llama-4-Maverick-17B-128E-Instruct",
+        "google/gemma-3-27b-it",
+    ]
+    mock_client._make_request.assert_called_once_with(
+        "GET", "/models", params={"expand": "details"}, stream_key="models"
+    )
+
+
+def test_search_models_uses_cache_on_second_call(mock_client, model_details):
     """Second search reuses cached model detail files (no extra detail fetches)."""
-    _setup_search_mock(mock_client, _BOTH_MODELS)
+    _setup_search_mock(mock_client, model_details, _BOTH_MODELS)
 
     search_models(mock_client)
     calls_after_first = mock_client._make_request.call_count
@@ -364,12 +389,40 @@ def test_search_models_uses_cache_on_second_call(mock_client):
     assert calls_after_second - calls_after_first == 1
 
 
+def test_get_models_preserves_order(mock_client, model_details):
+    """Bulk model lookups return models in the order they were requested."""
+    ids = list(reversed(_BOTH_MODELS))
+    _setup_search_mock(mock_client, model_details, ids)
+
+    results = get_models(mock_client, ids)
+
+    assert [model.repo_name for model in results] == ids
+
+
+def test_get_models_missing(mock_client, model_details):
+    """A missing model raises unless skip_missing is set."""
+    ids = ["google/gemma-3-27b-it", "org/missing"]
+
+    def _dispatch(method, endpoint, *args, **kwargs):
+        if endpoint == "/models/org/missing":
+            raise ResourceNotFoundError("models", "missing")
+        return model_details
+
+    mock_client._make_request.side_effect = _dispatch
+
+    with pytest.raises(ResourceNotFoundError):
+        get_models(mock_client, ids)
+
+    results = get_models(mock_client, ids, skip_missing=True)
+    assert [model.repo_name for model in results] == ["google/gemma-3-27b-it"]
+
+
 # Compatible platforms tests
 
 
-def test_get_compatible_platforms(mock_client):
+def test_get_compatible_platforms(mock_client, model_details):
     """Test getting compatible platforms for a model."""
-    mock_client._make_request.return_value = MOCK_MODEL_DETAILS
+    mock_client._make_request.return_value = model_details
     results = get_compatible_platforms(mock_client, "google/gemma-3-27b-it")
 
     assert len(results) == 3
@@ -399,3 +452,98 @@ def test_get_compatible_platforms_invalid_model_id(mock_client):
     """Test compatible platforms with an invalid model ID format."""
     with pytest.raises(ValidationError):
         get_compatible_platforms(mock_client, "invalid-model-id")
+
+
+# The 404 the snippet endpoint returns; tests only check its type or identity
+MOCK_SNIPPETS_NOT_FOUND = ResourceNotFoundError("snippets", "deploy")
+
+
+@pytest.fixture(scope="module")
+def sample_model(load_resource):
+    """
+    Fixture that provides the model_details.json model without validating it.
+
+    The tests using it only read configs_deploy.config_per_sku; Model
+    validation is covered by test_model_validation.
+    """
+    model_details = load_resource("model_details.json")
+    config_per_sku = model_details["configsDeploy"]["configPerSku"]
+    return Model.model_construct(
+        repo_name=model_details["repo_name"],
+        configs_deploy=ModelDeployConfigs.model_construct(
+            config_per_sku={
+                sku: [ModelConfig.model_construct(**config) for config in configs]
+                for sku, configs in config_per_sku.items()
+            }
+        ),
+    )
+
+
+class TestHandleResourceNotFound:
+    """Tests for turning snippet 404s into more specific errors."""
+
+    def test_handle_resource_not_found_model_error(self):
+        """A 404 about the model itself becomes a model ResourceNotFoundError."""
+        error = ResourceNotFoundError("models", "gemma-3-27b-it")
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            _handle_resource_not_found(
+                object(), error, "google/gemma-3-27b-it", "xe9680-nvidia-h100", 2
+            )
+        assert exc_info.value.resource_type == "model"
+        assert exc_info.value.resource_id == "google/gemma-3-27b-it"
+
+    def test_handle_resource_not_found_model_not_found(self, monkeypatch):
+        """If the model cannot be fetched, the model is reported missing."""
+
+        def _model_not_found(client, model_id):
+            raise ResourceNotFoundError("model", model_id)
+
+        monkeypatch.setattr("dell_ai.models.get_model", _model_not_found)
+        error = MOCK_SNIPPETS_NOT_FOUND
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            _handle_resource_not_found(
+                object(), error, "google/gemma-3-27b-it", "xe9680-nvidia-h100", 2
+            )
+        assert exc_info.value.resource_type == "model"
+
+    def test_handle_resource_not_found_invalid_gpus(self, sample_model, monkeypatch):
+        """An unsupported GPU count on a known platform is a ValidationError."""
+        monkeypatch.setattr("dell_ai.models.get_model", lambda *a, **kw: sample_model)
+        error = MOCK_SNIPPETS_NOT_FOUND
+        with pytest.raises(ValidationError) as exc_info:
+            _handle_resource_not_found(
+                object(), error, "google/gemma-3-27b-it", "xe9680-nvidia-h100", 4
+            )
+        assert exc_info.value.valid_values == [2]
+
+    def test_handle_resource_not_found_reraises_original(
+        self, sample_model, monkeypatch
+    ):
+        """Without a more specific cause the original error is re-raised."""
+        monkeypatch.setattr("dell_ai.models.get_model", lambda *a, **kw: sample_model)
+        error = MOCK_SNIPPETS_NOT_FOUND
+        with pytest.raises(ResourceNotFoundError) as exc_info:
+            _handle_resource_not_found(
+                object(), error, "google/gemma-3-27b-it", "xe9680-nvidia-h100", 2
+            )
+        assert exc_info.value is error
+
+    def test_handle_resource_not_found_reuses_fetched_model(
+        self, sample_model, monkeypatch
+    ):
+        """A model fetched during validation is not fetched again."""
+        fetched = []
+        monkeypatch.setattr(
+            "dell_ai.models.get_model", lambda *a, **kw: fetched.append(a)
+        )
+        error = MOCK_SNIPPETS_NOT_FOUND
+        with pytest.raises(ValidationError):
+            _handle_resource_not_found(
+                object(),
+                error,
+                "google/gemma-3-27b-it",
+                "xe9680-nvidia-h100",
+                4,
+                model=sample_model,
+            )
+        assert fetched == []
@@ -1,5 +1,3 @@
-from unittest.mock import MagicMock
-
 import pytest
 
 from dell_ai.exceptions import ResourceNotFoundError
@@ -22,42 +20,30 @@ MOCK_PLATFORMS_LIST = [
     "r760xa-nvidia-l40s",
 ]
 
-MOCK_PLATFORM_DETAILS = {
-    "id": "xe9680-nvidia-h100",
-    "name": "XE9680 Nvidia H100",
-    "disabled": False,
-    "platform_type": "server",
-    "platform": "XE9680",
-    "vendor": "Nvidia",
-    "acceleratorType": "GPU",
-    "accelerator": "H100SXM",
-    "gpuram": "80G",
-    "gpuinterconnect": "sxm",
-    "product_name": "NVIDIA-H100-80GB-HBM3",
-    "totalgpucount": 8,
-    "interconnect_east_west": "IB",
-    "interconnect_north_south": "ETH",
-}
+MOCK_PLATFORM_NOT_FOUND = ResourceNotFoundError("platform", "nonexistent-platform")
+
+# Marks a field to drop from the payload in parametrized overrides
+MISSING = object()
 
 
 @pytest.fixture
-def mock_client():
-    """Fixture that provides a mock Dell AI client."""
-    return MagicMock()
+def platform_details(load_resource):
+    """Fixture that provides a fresh copy of the XE9680 H100 platform payload."""
+    return load_resource("platform_details.json")
 
 
-def test_list_platforms(mock_client):
+def test_list_platforms(fake_client):
     """Test that list_platforms returns the correct list of platform IDs."""
-    mock_client._make_request.return_value = {"skus": MOCK_PLATFORMS_LIST}
-    result = list_platforms(mock_client)
+    fake_client.response = {"skus": MOCK_PLATFORMS_LIST}
+    result = list_platforms(fake_client)
     assert result == MOCK_PLATFORMS_LIST
-    mock_client._make_request.assert_called_once()
+    assert len(fake_client.calls) == 1
 
 
-def test_get_platform(mock_client):
+def test_get_platform(fake_client, platform_details):
     """Test that get_platform returns a properly constructed Platform object."""
-    mock_client._make_request.return_value = MOCK_PLATFORM_DETAILS
-    platform = get_platform(mock_client, "xe9680-nvidia-h100")
+    fake_client.response = platform_details
+    platform = get_platform(fake_client, "xe9680-nvidia-h100")
 
     assert isinstance(platform, Platform)
     assert platform.id == "xe9680-nvidia-h100"
@@ -75,35 +61,39 @@ def test_get_platform(mock_client):
     assert platform.interconnect_north_south == "ETH"
 
 
-def test_get_platform_not_found(mock_client):
+def test_get_platform_not_found(fake_client):
     """Test that get_platform raises ResourceNotFoundError for non-existent platforms."""
-    mock_client._make_request.side_effect = ResourceNotFoundError(
-        "platform", "nonexistent-platform"
-    )
+    fake_client.error = MOCK_PLATFORM_NOT_FOUND
     with pytest.raises(ResourceNotFoundError):
-        get_platform(mock_client, "nonexistent-platform")
+        get_platform(fake_client, "nonexistent-platform")
 
 
-def test_platform_validation():
-    """Test that Platform validation works correctly for both valid and invalid data."""
-    # Test valid platform data
-    platform = Platform(**MOCK_PLATFORM_DETAILS)
+def test_platform_validation(platform_details):
+    """Test that Platform validation accepts valid data."""
+    platform = Platform(**platform_details)
     assert platform.id == "xe9680-nvidia-h100"
 
-    # Test invalid platform data
-    with pytest.raises(ValueError):
-        Platform(**{**MOCK_PLATFORM_DETAILS, "totalgpucount": "not a number"})
 
-    # Test missing required field
+@pytest.mark.parametrize(
+    "field, value",
+    [("totalgpucount", "not a number"), ("id", MISSING)],
+    ids=["totalgpucount-not-a-number", "missing-id"],
+)
+def test_platform_validation_rejects(platform_details, field, value):
+    """Test that Platform validation rejects invalid data."""
+    if value is MISSING:
+        del platform_details[field]
+    else:
+        platform_details[field] = value
     with pytest.raises(ValueError):
-        Platform(**{k: v for k, v in MOCK_PLATFORM_DETAILS.items() if k != "id"})
+        Platform(**platform_details)
 
 
-def test_get_platform_info(mock_client, mock_sys_info):
+def test_get_platform_info(fake_client, mock_sys_info):
     """Test that validates get_platform_info method"""
 
-    mock_client._make_request.return_value = mock_sys_info
-    platform_infos = get_platform_system_info(mock_client, "r760xa-nvidia-l40s")
+    fake_client.response = mock_sys_info
+    platform_infos = get_platform_system_info(fake_client, "r760xa-nvidia-l40s")
 
     assert isinstance(platform_infos, list)
     assert isinstance(platform_infos[0], SystemInfo)
@@ -111,10 +101,8 @@ def test_get_platform_info(mock_client, mock_sys_info):
     assert platform_infos[0].software.nvidia is not None
 
 
-def test_get_platform_info_not_found(mock_client):
+def test_get_platform_info_not_found(fake_client):
     """Test that get_platform raises ResourceNotFoundError for non-existent platforms."""
-    mock_client._make_request.side_effect = ResourceNotFoundError(
-        "platform", "nonexistent-platform"
-    )
+    fake_client.error = MOCK_PLATFORM_NOT_FOUND
     with pytest.raises(ResourceNotFoundError):
-        get_platform_system_info(mock_client, "nonexistent-platform")
+        get_platform_system_info(fake_client, "nonexistent-platform")